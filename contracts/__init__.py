@@ -4,48 +4,108 @@ contracts/__init__.py
 Public API for plugin contracts.
 
 Exports all contract classes and supporting types for plugin development.
+
+Submodules are loaded lazily (PEP 562): a plugin subprocess typically uses a
+single contract type, so `from contracts import LLMContract` only imports
+base.py and llm_contract.py, never the TTS/STT contracts.
 """
 
-# D001 - Base contract and types
-from .base import (
-    HealthStatus,
-    PluginBase,
-    PluginFactory,
-    PluginManifest,
-    PluginStatus,
-)
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    # D001 - Base contract and types
+    from .base import (
+        HealthStatus,
+        PluginBase,
+        PluginFactory,
+        PluginManifest,
+        PluginStatus,
+    )
+
+    # D004 - LLM contract and types
+    from .llm_contract import (
+        CompletionOptions,
+        CompletionResult,
+        FinishReason,
+        LLMContract,
+        Message,
+        MessageRole,
+        Model,
+        StreamChunk,
+        TokenUsage,
+    )
+
+    # D003 - STT contract and types
+    from .stt_contract import (
+        StreamingAudioBuffer,
+        StreamingConfig,
+        STTContract,
+        TranscriptionOptions,
+        TranscriptionResult,
+        TranscriptionSegment,
+        TranscriptionStatus,
+    )
+
+    # D002 - TTS contract and types
+    from .tts_contract import (
+        AudioFormat,
+        SynthesisOptions,
+        SynthesisResult,
+        TTSContract,
+        Voice,
+    )
+
+# Public name -> defining submodule
+_LAZY_EXPORTS: dict[str, str] = {
+    # D001 - Base
+    "PluginBase": "base",
+    "PluginStatus": "base",
+    "PluginManifest": "base",
+    "HealthStatus": "base",
+    "PluginFactory": "base",
+    # D002 - TTS
+    "TTSContract": "tts_contract",
+    "Voice": "tts_contract",
+    "SynthesisResult": "tts_contract",
+    "SynthesisOptions": "tts_contract",
+    "AudioFormat": "tts_contract",
+    # D003 - STT
+    "STTContract": "stt_contract",
+    "TranscriptionResult": "stt_contract",
+    "TranscriptionSegment": "stt_contract",
+    "TranscriptionOptions": "stt_contract",
+    "TranscriptionStatus": "stt_contract",
+    "StreamingConfig": "stt_contract",
+    "StreamingAudioBuffer": "stt_contract",
+    # D004 - LLM
+    "LLMContract": "llm_contract",
+    "Message": "llm_contract",
+    "MessageRole": "llm_contract",
+    "Model": "llm_contract",
+    "CompletionResult": "llm_contract",
+    "CompletionOptions": "llm_contract",
+    "StreamChunk": "llm_contract",
+    "TokenUsage": "llm_contract",
+    "FinishReason": "llm_contract",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import the defining submodule on first access and cache the export."""
+    submodule = _LAZY_EXPORTS.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(f".{submodule}", __name__), name)
+    globals()[name] = value
+    return value
 
-# D004 - LLM contract and types
-from .llm_contract import (
-    CompletionOptions,
-    CompletionResult,
-    FinishReason,
-    LLMContract,
-    Message,
-    MessageRole,
-    Model,
-    StreamChunk,
-    TokenUsage,
-)
 
-# D003 - STT contract and types
-from .stt_contract import (
-    StreamingConfig,
-    STTContract,
-    TranscriptionOptions,
-    TranscriptionResult,
-    TranscriptionSegment,
-    TranscriptionStatus,
-)
+def __dir__() -> list[str]:
+    """List public exports without triggering submodule imports."""
+    return sorted(set(globals()) | set(__all__))
 
-# D002 - TTS contract and types
-from .tts_contract import (
-    AudioFormat,
-    SynthesisOptions,
-    SynthesisResult,
-    TTSContract,
-    Voice,
-)
 
 __all__ = [
     # Base
@@ -67,6 +127,7 @@ __all__ = [
     "TranscriptionOptions",
     "TranscriptionStatus",
     "StreamingConfig",
+    "StreamingAudioBuffer",
     # LLM
     "LLMContract",
     "Message",
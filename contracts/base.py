@@ -31,7 +31,7 @@ class PluginStatus(Enum):
     STOPPED = "stopped"  # Cleanly stopped
 
 
-@dataclass
+@dataclass(slots=True)
 class PluginManifest:
     """
     Plugin metadata structure matching config/manifest_schema.json (D008).
@@ -87,8 +87,25 @@ class PluginManifest:
             config_schema=data.get("config_schema", {}),
         )
 
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Pickle as a direct constructor call (skips copyreg state handling)."""
+        return (
+            type(self),
+            (
+                self.name,
+                self.version,
+                self.contract,
+                self.entry_point,
+                self.display_name,
+                self.description,
+                self.author,
+                self.dependencies,
+                self.config_schema,
+            ),
+        )
+
 
-@dataclass
+@dataclass(slots=True)
 class HealthStatus:
     """
     Health check response structure.
@@ -109,8 +126,9 @@ class HealthStatus:
 
     def to_dict(self) -> dict[str, Any]:
         """Serialize health status for JSON-RPC responses."""
+        # _value_ is a plain instance attribute; .value is a property lookup
         result: dict[str, Any] = {
-            "status": self.status.value,
+            "status": self.status._value_,
             "message": self.message,
             "details": self.details,
         }
@@ -152,6 +170,9 @@ class PluginBase(ABC):
                 )
     """
 
+    # Subclasses still get a __dict__ unless they declare __slots__ themselves
+    __slots__ = ("_status", "_manifest", "_config", "_name", "_version", "_contract_type")
+
     def __init__(self) -> None:
         """
         Initialize plugin instance.
@@ -163,6 +184,11 @@ class PluginBase(ABC):
         self._manifest: PluginManifest | None = None
         self._config: dict[str, Any] = {}
 
+        # Manifest-derived identity, refreshed by set_manifest()
+        self._name: str = "unknown"
+        self._version: str = "0.0.0"
+        self._contract_type: str = "base"
+
     @abstractmethod
     async def initialize(self, config: dict[str, Any]) -> bool:
         """
@@ -226,6 +252,9 @@ class PluginBase(ABC):
             manifest: Parsed manifest from manifest.json
         """
         self._manifest = manifest
+        self._name = manifest.name
+        self._version = manifest.version
+        self._contract_type = manifest.contract
 
     @property
     def status(self) -> PluginStatus:
@@ -235,17 +264,17 @@ class PluginBase(ABC):
     @property
     def name(self) -> str:
         """Get plugin name from manifest."""
-        return self._manifest.name if self._manifest else "unknown"
+        return self._name
 
     @property
     def version(self) -> str:
         """Get plugin version from manifest."""
-        return self._manifest.version if self._manifest else "0.0.0"
+        return self._version
 
     @property
     def contract_type(self) -> str:
         """Get contract type from manifest."""
-        return self._manifest.contract if self._manifest else "base"
+        return self._contract_type
 
 
 # Type alias for plugin factory functions
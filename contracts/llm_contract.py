@@ -11,7 +11,7 @@ All LLM plugins (Ollama, Gemini, OpenAI, etc.) MUST implement this contract.
 
 from abc import abstractmethod
 from collections.abc import AsyncIterator
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from enum import Enum
 from typing import Any
 
@@ -38,7 +38,11 @@ class FinishReason(Enum):
     ERROR = "error"  # Generation error
 
 
-@dataclass
+# Value -> member lookup for inbound messages; bypasses EnumType.__call__
+_MESSAGE_ROLE_BY_VALUE: dict[str, MessageRole] = {role.value: role for role in MessageRole}
+
+
+@dataclass(slots=True)
 class Message:
     """
     A message in the conversation.
@@ -59,8 +63,9 @@ class Message:
 
     def to_dict(self) -> dict[str, Any]:
         """Serialize message for API calls."""
+        # _value_ is a plain instance attribute; .value is a property lookup
         result: dict[str, Any] = {
-            "role": self.role.value,
+            "role": self.role._value_,
             "content": self.content,
         }
         if self.name:
@@ -74,16 +79,21 @@ class Message:
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "Message":
         """Create message from dictionary."""
+        role = data["role"]
         return cls(
-            role=MessageRole(data["role"]),
+            role=_MESSAGE_ROLE_BY_VALUE.get(role) or MessageRole(role),
             content=data.get("content", ""),
             name=data.get("name"),
             tool_call_id=data.get("tool_call_id"),
             tool_calls=data.get("tool_calls", []),
         )
 
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Pickle as a direct constructor call (skips copyreg state handling)."""
+        return (type(self), (self.role, self.content, self.name, self.tool_call_id, self.tool_calls))
 
-@dataclass
+
+@dataclass(slots=True)
 class Model:
     """
     LLM model definition.
@@ -115,8 +125,15 @@ class Model:
             "capabilities": self.capabilities,
         }
 
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Pickle as a direct constructor call (skips copyreg state handling)."""
+        return (
+            type(self),
+            (self.id, self.name, self.provider, self.context_length, self.description, self.capabilities),
+        )
+
 
-@dataclass
+@dataclass(slots=True)
 class CompletionOptions:
     """
     Options for LLM completion.
@@ -148,6 +165,9 @@ class CompletionOptions:
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "CompletionOptions":
         """Create options from dictionary."""
+        # Common case: only known keys, so the generated __init__ binds them directly
+        if data.keys() <= _COMPLETION_OPTION_FIELDS:
+            return cls(**data)
         return cls(
             model=data.get("model"),
             temperature=data.get("temperature", 0.0),
@@ -162,7 +182,10 @@ class CompletionOptions:
         )
 
 
-@dataclass
+_COMPLETION_OPTION_FIELDS: frozenset[str] = frozenset(f.name for f in fields(CompletionOptions))
+
+
+@dataclass(slots=True)
 class TokenUsage:
     """
     Token usage statistics.
@@ -185,8 +208,12 @@ class TokenUsage:
             "total_tokens": self.total_tokens,
         }
 
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Pickle as a direct constructor call (skips copyreg state handling)."""
+        return (type(self), (self.prompt_tokens, self.completion_tokens, self.total_tokens))
+
 
-@dataclass
+@dataclass(slots=True)
 class CompletionResult:
     """
     Result of LLM completion operation.
@@ -211,7 +238,7 @@ class CompletionResult:
         """Serialize result for JSON-RPC responses."""
         return {
             "content": self.content,
-            "finish_reason": self.finish_reason.value,
+            "finish_reason": self.finish_reason._value_,
             "model": self.model,
             "usage": self.usage.to_dict(),
             "tool_calls": self.tool_calls,
@@ -219,7 +246,7 @@ class CompletionResult:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class StreamChunk:
     """
     A chunk from streaming completion.
@@ -238,7 +265,7 @@ class StreamChunk:
         """Serialize chunk for JSON-RPC responses."""
         result: dict[str, Any] = {"content": self.content}
         if self.finish_reason:
-            result["finish_reason"] = self.finish_reason.value
+            result["finish_reason"] = self.finish_reason._value_
         if self.tool_calls:
             result["tool_calls"] = self.tool_calls
         return result
@@ -11,7 +11,7 @@ All STT plugins (Moonshine, Whisper, Vosk, etc.) MUST implement this contract.
 
 from abc import abstractmethod
 from collections.abc import Callable
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from enum import Enum
 from typing import Any
 
@@ -29,7 +29,7 @@ class TranscriptionStatus(Enum):
     CANCELLED = "cancelled"
 
 
-@dataclass
+@dataclass(slots=True)
 class TranscriptionSegment:
     """
     A segment of transcribed text with timing information.
@@ -69,7 +69,7 @@ class TranscriptionSegment:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class TranscriptionResult:
     """
     Result of STT transcription operation.
@@ -97,12 +97,12 @@ class TranscriptionResult:
             "segments": [s.to_dict() for s in self.segments],
             "language": self.language,
             "duration_ms": self.duration_ms,
-            "status": self.status.value,
+            "status": self.status._value_,
             "metadata": self.metadata,
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class TranscriptionOptions:
     """
     Options for STT transcription.
@@ -132,6 +132,9 @@ class TranscriptionOptions:
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "TranscriptionOptions":
         """Create options from dictionary."""
+        # Common case: only known keys, so the generated __init__ binds them directly
+        if data.keys() <= _TRANSCRIPTION_OPTION_FIELDS:
+            return cls(**data)
         return cls(
             language=data.get("language"),
             task=data.get("task", "transcribe"),
@@ -145,11 +148,27 @@ class TranscriptionOptions:
         )
 
 
-@dataclass
+_TRANSCRIPTION_OPTION_FIELDS: frozenset[str] = frozenset(f.name for f in fields(TranscriptionOptions))
+
+
+# Bytes per sample for the raw PCM encodings accepted by StreamingConfig
+_BYTES_PER_SAMPLE: dict[str, int] = {
+    "pcm_u8": 1,
+    "pcm_s16le": 2,
+    "pcm_s24le": 3,
+    "pcm_s32le": 4,
+    "pcm_f32le": 4,
+}
+
+
+@dataclass(slots=True)
 class StreamingConfig:
     """
     Configuration for streaming transcription.
 
+    Plugins accumulating fed chunks should use StreamingAudioBuffer rather
+    than concatenating bytes objects, which copies the whole utterance per chunk.
+
     Attributes:
         sample_rate: Audio sample rate in Hz
         channels: Number of audio channels (1 = mono, 2 = stereo)
@@ -157,6 +176,11 @@ class StreamingConfig:
         chunk_duration_ms: Duration of each audio chunk
         vad_enabled: Enable voice activity detection
         vad_threshold: VAD confidence threshold (0.0 to 1.0)
+
+    Derived at construction (read these instead of recomputing per chunk):
+        bytes_per_sample: Bytes per sample for the encoding (0 if not raw PCM)
+        samples_per_chunk: Samples per channel in one chunk
+        chunk_bytes: Expected size of one chunk in bytes (0 if not raw PCM)
     """
 
     sample_rate: int = 16000
@@ -165,6 +189,104 @@ class StreamingConfig:
     chunk_duration_ms: int = 100
     vad_enabled: bool = True
     vad_threshold: float = 0.5
+    bytes_per_sample: int = field(init=False, repr=False, compare=False)
+    samples_per_chunk: int = field(init=False, repr=False, compare=False)
+    chunk_bytes: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Compute per-chunk sizes once from the stream format."""
+        self.bytes_per_sample = _BYTES_PER_SAMPLE.get(self.encoding, 0)
+        self.samples_per_chunk = self.sample_rate * self.chunk_duration_ms // 1000
+        self.chunk_bytes = self.samples_per_chunk * self.channels * self.bytes_per_sample
+
+
+class StreamingAudioBuffer:
+    """
+    Bounded, append-only buffer for raw PCM fed during streaming transcription.
+
+    Appends are amortized O(1) (bytearray growth), and the oldest audio is
+    dropped once max_seconds is exceeded, so memory stays bounded for long
+    sessions.
+
+    Example:
+        async def start_streaming(self, config, callback=None):
+            self._audio = StreamingAudioBuffer(config, max_seconds=30)
+            ...
+
+        async def feed_audio(self, chunk):
+            self._audio.feed(chunk)
+            window = self._audio.window(5.0)  # last 5 seconds as bytes
+    """
+
+    __slots__ = ("_buffer", "_bytes_per_second", "_frame_bytes", "_max_bytes")
+
+    def __init__(self, config: StreamingConfig, max_seconds: float = 120.0) -> None:
+        """
+        Initialize buffer for the given stream format.
+
+        Args:
+            config: Streaming configuration (sample rate, channels, encoding)
+            max_seconds: Maximum audio duration to retain
+
+        Raises:
+            ValueError: If config.encoding is not a raw PCM encoding
+        """
+        if not config.bytes_per_sample:
+            raise ValueError(f"Unsupported encoding for StreamingAudioBuffer: {config.encoding}")
+
+        self._frame_bytes = config.bytes_per_sample * config.channels
+        self._bytes_per_second = config.sample_rate * self._frame_bytes
+        self._max_bytes = self._align(int(max_seconds * self._bytes_per_second))
+        self._buffer = bytearray()
+
+    def _align(self, num_bytes: int) -> int:
+        """Round down to a whole number of sample frames."""
+        return num_bytes - num_bytes % self._frame_bytes
+
+    def feed(self, chunk: bytes) -> None:
+        """
+        Append an audio chunk, dropping the oldest audio beyond max_seconds.
+
+        Args:
+            chunk: Raw audio bytes matching the StreamingConfig format
+        """
+        self._buffer += chunk
+        overflow = len(self._buffer) - self._max_bytes
+        if overflow > 0:
+            # Deleting from the front of a bytearray only moves its start offset
+            del self._buffer[: overflow + (-overflow) % self._frame_bytes]
+
+    def window(self, seconds: float | None = None) -> bytes:
+        """
+        Get the most recent audio.
+
+        Args:
+            seconds: Duration to return (None = everything buffered)
+
+        Returns:
+            Raw audio bytes, aligned to whole sample frames.
+        """
+        if seconds is None:
+            return bytes(self._buffer)
+        num_bytes = min(self._align(int(seconds * self._bytes_per_second)), len(self._buffer))
+        if num_bytes <= 0:
+            return b""
+        # Slice through a memoryview so only the returned bytes are copied
+        with memoryview(self._buffer) as view:
+            return bytes(view[-num_bytes:])
+
+    def clear(self) -> None:
+        """Drop all buffered audio."""
+        self._buffer.clear()
+
+    @property
+    def duration_ms(self) -> float:
+        """Duration of buffered audio in milliseconds."""
+        return len(self._buffer) * 1000 / self._bytes_per_second
+
+    def __len__(self) -> int:
+        """Number of buffered bytes."""
+        return len(self._buffer)
 
 
 class STTContract(PluginBase):
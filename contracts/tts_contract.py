@@ -9,15 +9,24 @@ Prefix: tts_ (defined in config/contract_prefixes.yaml D005)
 All TTS plugins (Kokoro, Piper, Coqui, etc.) MUST implement this contract.
 """
 
+import base64
 from abc import abstractmethod
 from collections.abc import AsyncIterator
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from enum import Enum
 from typing import Any
 
 # Import from D001 - no forward references
 from .base import PluginBase
 
+# Optional SIMD base64 encoder for audio payloads (falls back to stdlib base64)
+try:
+    import pybase64
+
+    HAS_PYBASE64 = True
+except ImportError:
+    HAS_PYBASE64 = False
+
 
 class AudioFormat(Enum):
     """Supported audio output formats."""
@@ -29,7 +38,11 @@ class AudioFormat(Enum):
     OPUS = "opus"
 
 
-@dataclass
+# Value -> member lookup for inbound options; bypasses EnumType.__call__
+_AUDIO_FORMAT_BY_VALUE: dict[str, AudioFormat] = {fmt.value: fmt for fmt in AudioFormat}
+
+
+@dataclass(slots=True)
 class Voice:
     """
     Voice definition for TTS synthesis.
@@ -65,7 +78,7 @@ class Voice:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class SynthesisResult:
     """
     Result of TTS synthesis operation.
@@ -93,11 +106,15 @@ class SynthesisResult:
         Serialize for JSON-RPC responses.
         Note: audio_data is base64 encoded for JSON transport.
         """
-        import base64
+        if HAS_PYBASE64:
+            # Encodes straight to str, skipping the intermediate bytes object
+            audio_b64 = pybase64.b64encode_as_string(self.audio_data)
+        else:
+            audio_b64 = base64.b64encode(self.audio_data).decode("ascii")
 
         return {
-            "audio_data": base64.b64encode(self.audio_data).decode("utf-8"),
-            "format": self.format.value,
+            "audio_data": audio_b64,
+            "format": self.format._value_,
             "sample_rate": self.sample_rate,
             "duration_ms": self.duration_ms,
             "text": self.text,
@@ -106,7 +123,7 @@ class SynthesisResult:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class SynthesisOptions:
     """
     Options for TTS synthesis.
@@ -130,16 +147,27 @@ class SynthesisOptions:
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "SynthesisOptions":
         """Create options from dictionary."""
+        fmt = data.get("format", "wav")
+        audio_format = _AUDIO_FORMAT_BY_VALUE.get(fmt) or AudioFormat(fmt)
+
+        # Common case: only known keys, so the generated __init__ binds them directly
+        if data.keys() <= _SYNTHESIS_OPTION_FIELDS:
+            options = cls(**data)
+            options.format = audio_format
+            return options
         return cls(
             speed=data.get("speed", 1.0),
             pitch=data.get("pitch", 0.0),
             volume=data.get("volume", 1.0),
-            format=AudioFormat(data.get("format", "wav")),
+            format=audio_format,
             sample_rate=data.get("sample_rate"),
             language=data.get("language"),
         )
 
 
+_SYNTHESIS_OPTION_FIELDS: frozenset[str] = frozenset(f.name for f in fields(SynthesisOptions))
+
+
 class TTSContract(PluginBase):
     """
     Abstract contract for Text-to-Speech plugins.
@@ -177,6 +205,28 @@ class TTSContract(PluginBase):
         super().__init__()
         self._current_voice_id: str | None = None
         self._voices: list[Voice] = []
+        # Languages from the last get_supported_languages(); reset whenever _voices changes
+        self._languages_cache: tuple[str, ...] | None = None
+
+    @property
+    def _voices(self) -> list[Voice]:
+        """Voices offered by this plugin (subclasses assign or edit this list)."""
+        return self._voice_list
+
+    @_voices.setter
+    def _voices(self, voices: list[Voice]) -> None:
+        # Assigning a new list always drops the cached languages
+        self._voice_list = voices
+        self._languages_cache = None
+
+    def invalidate_languages_cache(self) -> None:
+        """
+        Drop the cached get_supported_languages() result.
+
+        Assigning self._voices does this automatically; call it after
+        editing the voice list in place (append, remove, item assignment).
+        """
+        self._languages_cache = None
 
     @abstractmethod
     async def synthesize(
@@ -279,4 +329,8 @@ class TTSContract(PluginBase):
         Returns:
             List of BCP-47 language codes (e.g., ["en-US", "ja-JP"]).
         """
-        return list(set(v.language for v in self._voices))
+        languages = self._languages_cache
+        if languages is None:
+            languages = tuple(dict.fromkeys(v.language for v in self._voice_list))
+            self._languages_cache = languages
+        return list(languages)
@@ -26,13 +26,28 @@ Usage:
     from plugins._host.protocol import JsonRpcRouter
 """
 
+import atexit
+import functools
+import importlib
 import io
 import logging
 import os
 import sys
-from datetime import datetime
+import time
 from pathlib import Path
-from typing import Any, Optional
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Optional
+
+if TYPE_CHECKING:
+    from logging.handlers import QueueListener
+
+    from .discovery import DiscoveredPlugin, HybridDiscovery, discover_plugins
+    from .isolation import CrashReport, ExecutionResult, IsolatedExecutor
+    from .loader import LoadedPlugin, PluginLoader, initialize_plugin, shutdown_plugin
+    from .manager import HotSwapResult, PluginManager, get_manager, set_manager
+    from .protocol import JsonRpcError, JsonRpcRequest, JsonRpcResponse, JsonRpcRouter
+    from .shutdown import ShutdownHandler, ShutdownReason
+    from .validator import PluginValidator, ValidationResult, validate_plugin
 
 # Package version
 __version__ = "1.0.0"
@@ -59,15 +74,16 @@ def _configure_unbuffered_stdout() -> None:
     # Method 1: Environment variable (affects child processes too)
     os.environ["PYTHONUNBUFFERED"] = "1"
 
-    # Method 2: Reconfigure stdout (Python 3.7+)
+    # Method 2: Reconfigure stdout in place (Python 3.7+)
     if hasattr(sys.stdout, "reconfigure"):
         try:
             sys.stdout.reconfigure(line_buffering=True, write_through=True)
+            return
         except Exception:
             pass  # Fall through to method 3
 
     # Method 3: Replace stdout with unbuffered wrapper
-    # This is the most reliable method, especially on Windows
+    # Only needed when stdout can't be reconfigured (e.g. replaced by a non-TextIOWrapper)
     try:
         sys.stdout = io.TextIOWrapper(
             io.BufferedWriter(io.FileIO(sys.stdout.fileno(), mode="wb", closefd=False)),
@@ -97,42 +113,43 @@ DEFAULT_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
 # Logger name prefix for all Plugin Host loggers
 LOGGER_PREFIX = "plugin_host"
 
-# Log levels mapping
-LOG_LEVELS = {
-    "DEBUG": logging.DEBUG,
-    "INFO": logging.INFO,
-    "WARNING": logging.WARNING,
-    "WARN": logging.WARNING,
-    "ERROR": logging.ERROR,
-    "CRITICAL": logging.CRITICAL,
-}
+# Log levels mapping (read-only)
+LOG_LEVELS = MappingProxyType(
+    {
+        "DEBUG": logging.DEBUG,
+        "INFO": logging.INFO,
+        "WARNING": logging.WARNING,
+        "WARN": logging.WARNING,
+        "ERROR": logging.ERROR,
+        "CRITICAL": logging.CRITICAL,
+    }
+)
+
+
+@functools.lru_cache(maxsize=16)
+def _resolve_level(level: str, default: int) -> int:
+    """Map a level name (any case) to its numeric level, or default if unknown."""
+    return LOG_LEVELS.get(level.upper(), default)
 
 
 class StderrHandler(logging.StreamHandler):
     """
     A StreamHandler that ALWAYS writes to stderr.
 
-    This ensures log messages never contaminate the stdout JSON-RPC channel,
-    even if sys.stderr is reassigned elsewhere.
+    This ensures log messages never contaminate the stdout JSON-RPC channel.
+    The stream is captured once at construction; StreamHandler.emit already
+    flushes after every record. Call refresh_stream() if sys.stderr is
+    reassigned after the handler is created.
     """
 
     def __init__(self) -> None:
         """Initialize with stderr as the stream."""
         super().__init__(stream=sys.stderr)
 
-    def emit(self, record: logging.LogRecord) -> None:
-        """
-        Emit a record to stderr.
-
-        Overrides parent to explicitly use sys.stderr at emit time,
-        in case stderr was reassigned after handler creation.
-        """
-        try:
-            self.stream = sys.stderr
-            super().emit(record)
-            self.flush()
-        except Exception:
-            self.handleError(record)
+    def refresh_stream(self) -> None:
+        """Re-point the handler at the current sys.stderr."""
+        if self.stream is not sys.stderr:
+            self.setStream(sys.stderr)
 
 
 class JsonRpcSafeFormatter(logging.Formatter):
@@ -144,14 +161,13 @@ class JsonRpcSafeFormatter(logging.Formatter):
     """
 
     LOG_PREFIX = "[LOG] "
+    _LINE_PREFIX = "\n" + LOG_PREFIX
 
     def format(self, record: logging.LogRecord) -> str:
         """Format the record with a non-JSON prefix."""
         formatted = super().format(record)
-        # Prefix each line to distinguish from JSON-RPC
-        lines = formatted.split("\n")
-        prefixed = "\n".join(f"{self.LOG_PREFIX}{line}" for line in lines)
-        return prefixed
+        # Prefix each line (including tracebacks) to distinguish from JSON-RPC
+        return self.LOG_PREFIX + formatted.replace("\n", self._LINE_PREFIX)
 
 
 def configure_host_logging(
@@ -177,13 +193,14 @@ def configure_host_logging(
         >>> logger.info("Starting discovery...")  # Goes to stderr
     """
     # Get numeric level
-    numeric_level = LOG_LEVELS.get(level.upper(), logging.INFO)
+    numeric_level = _resolve_level(level, logging.INFO)
 
     # Get root logger for plugin host
     root_logger = logging.getLogger(LOGGER_PREFIX)
     root_logger.setLevel(numeric_level)
 
-    # Remove any existing handlers
+    # Remove any existing handlers (stopping the file-logging thread, if any)
+    _stop_file_logging()
     root_logger.handlers.clear()
 
     # Create stderr handler
@@ -233,6 +250,28 @@ def get_logger(name: str) -> logging.Logger:
 # FILE LOGGING (OPTIONAL)
 # ============================================
 
+# Active file-logging listener thread and the QueueHandler feeding it
+_file_listener: "QueueListener | None" = None
+_file_queue_handler: logging.Handler | None = None
+
+
+def _stop_file_logging() -> None:
+    """Detach file logging, flush queued records and close the log file."""
+    global _file_listener, _file_queue_handler
+
+    if _file_queue_handler is not None:
+        logging.getLogger(LOGGER_PREFIX).removeHandler(_file_queue_handler)
+        _file_queue_handler = None
+
+    if _file_listener is not None:
+        listener, _file_listener = _file_listener, None
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+
+
+atexit.register(_stop_file_logging)
+
 
 def add_file_logging(
     log_file: str | Path,
@@ -243,13 +282,24 @@ def add_file_logging(
     """
     Add rotating file logging in addition to stderr.
 
+    Records are handed to a background QueueListener thread, so logging
+    calls on the JSON-RPC path never block on disk writes or rotation.
+    Calling this again replaces the previous log file (its thread is
+    stopped and its file closed).
+
     Args:
         log_file: Path to log file
         level: Log level for file handler
         max_bytes: Maximum file size before rotation
         backup_count: Number of backup files to keep
     """
-    from logging.handlers import RotatingFileHandler
+    global _file_listener, _file_queue_handler
+
+    import queue
+    from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+    # Only one file log at a time; stop and close the previous one
+    _stop_file_logging()
 
     # Ensure log directory exists
     log_path = Path(log_file)
@@ -264,14 +314,23 @@ def add_file_logging(
     )
 
     # Configure handler
-    numeric_level = LOG_LEVELS.get(level.upper(), logging.DEBUG)
+    numeric_level = _resolve_level(level, logging.DEBUG)
     file_handler.setLevel(numeric_level)
 
     formatter = logging.Formatter(fmt=DEFAULT_LOG_FORMAT, datefmt=DEFAULT_DATE_FORMAT)
     file_handler.setFormatter(formatter)
 
+    # Write from a background thread; _stop_file_logging flushes remaining
+    # records and closes the file on reconfiguration and at exit
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    _file_listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+    _file_listener.start()
+
+    _file_queue_handler = QueueHandler(log_queue)
+    _file_queue_handler.setLevel(numeric_level)
+
     # Add to root logger
-    root_logger.addHandler(file_handler)
+    root_logger.addHandler(_file_queue_handler)
 
 
 # ============================================
@@ -292,8 +351,8 @@ def log_startup_info(logger: logging.Logger) -> None:
     logger.info(f"Version: {__version__}")
     logger.info(f"Python: {sys.version}")
     logger.info(f"Platform: {sys.platform}")
-    logger.info(f"Working Directory: {Path.cwd()}")
-    logger.info(f"Timestamp: {datetime.now().isoformat()}")
+    logger.info(f"Working Directory: {os.getcwd()}")
+    logger.info(f"Timestamp: {time.strftime('%Y-%m-%dT%H:%M:%S')}")
     logger.info("=" * 60)
 
 
@@ -307,7 +366,7 @@ def log_shutdown_info(logger: logging.Logger, reason: str = "Normal") -> None:
     """
     logger.info("=" * 60)
     logger.info(f"Plugin Host Shutting Down: {reason}")
-    logger.info(f"Timestamp: {datetime.now().isoformat()}")
+    logger.info(f"Timestamp: {time.strftime('%Y-%m-%dT%H:%M:%S')}")
     logger.info("=" * 60)
 
 
@@ -316,47 +375,52 @@ def log_shutdown_info(logger: logging.Logger, reason: str = "Normal") -> None:
 # ============================================
 
 
-# Core modules (lazy imports to avoid circular dependencies)
-def _import_discovery() -> tuple[Any, ...]:
-    from .discovery import DiscoveredPlugin, HybridDiscovery, discover_plugins
-
-    return HybridDiscovery, DiscoveredPlugin, discover_plugins
-
-
-def _import_validator() -> tuple[Any, ...]:
-    from .validator import PluginValidator, ValidationResult, validate_plugin
-
-    return PluginValidator, ValidationResult, validate_plugin
-
-
-def _import_loader() -> tuple[Any, ...]:
-    from .loader import LoadedPlugin, PluginLoader, initialize_plugin, shutdown_plugin
-
-    return PluginLoader, LoadedPlugin, initialize_plugin, shutdown_plugin
-
-
-def _import_manager() -> tuple[Any, ...]:
-    from .manager import HotSwapResult, PluginManager, get_manager, set_manager
-
-    return PluginManager, HotSwapResult, get_manager, set_manager
-
-
-def _import_protocol() -> tuple[Any, ...]:
-    from .protocol import JsonRpcError, JsonRpcRequest, JsonRpcResponse, JsonRpcRouter
-
-    return JsonRpcRouter, JsonRpcRequest, JsonRpcResponse, JsonRpcError
-
-
-def _import_isolation() -> tuple[Any, ...]:
-    from .isolation import CrashReport, ExecutionResult, IsolatedExecutor
-
-    return IsolatedExecutor, CrashReport, ExecutionResult
+# Core modules are imported on first attribute access (PEP 562), which avoids
+# circular imports and keeps them out of the host's startup path until needed.
+# Public name -> defining submodule
+_LAZY_EXPORTS: dict[str, str] = {
+    # D020 - Discovery
+    "HybridDiscovery": "discovery",
+    "DiscoveredPlugin": "discovery",
+    "discover_plugins": "discovery",
+    # D022 - Validation
+    "PluginValidator": "validator",
+    "ValidationResult": "validator",
+    "validate_plugin": "validator",
+    # D023 - Loading
+    "PluginLoader": "loader",
+    "LoadedPlugin": "loader",
+    "initialize_plugin": "loader",
+    "shutdown_plugin": "loader",
+    # D024 - Management
+    "PluginManager": "manager",
+    "HotSwapResult": "manager",
+    "get_manager": "manager",
+    "set_manager": "manager",
+    # D026 - Protocol
+    "JsonRpcRouter": "protocol",
+    "JsonRpcRequest": "protocol",
+    "JsonRpcResponse": "protocol",
+    "JsonRpcError": "protocol",
+    # D028 - Isolation
+    "IsolatedExecutor": "isolation",
+    "CrashReport": "isolation",
+    "ExecutionResult": "isolation",
+    # D027 - Shutdown
+    "ShutdownHandler": "shutdown",
+    "ShutdownReason": "shutdown",
+}
 
 
-def _import_shutdown() -> tuple[Any, ...]:
-    from .shutdown import ShutdownHandler, ShutdownReason
+def __getattr__(name: str) -> Any:
+    """Import the defining submodule on first access and cache the export."""
+    submodule = _LAZY_EXPORTS.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-    return ShutdownHandler, ShutdownReason
+    value = getattr(importlib.import_module(f".{submodule}", __name__), name)
+    globals()[name] = value
+    return value
 
 
 # Public API
@@ -376,12 +440,28 @@ __all__ = [
     "DEFAULT_LOG_FORMAT",
     "DEFAULT_DATE_FORMAT",
     "LOG_LEVELS",
-    # Lazy import helpers (for avoiding circular imports)
-    "_import_discovery",
-    "_import_validator",
-    "_import_loader",
-    "_import_manager",
-    "_import_protocol",
-    "_import_isolation",
-    "_import_shutdown",
+    # Core components (lazily imported)
+    "HybridDiscovery",
+    "DiscoveredPlugin",
+    "discover_plugins",
+    "PluginValidator",
+    "ValidationResult",
+    "validate_plugin",
+    "PluginLoader",
+    "LoadedPlugin",
+    "initialize_plugin",
+    "shutdown_plugin",
+    "PluginManager",
+    "HotSwapResult",
+    "get_manager",
+    "set_manager",
+    "JsonRpcRouter",
+    "JsonRpcRequest",
+    "JsonRpcResponse",
+    "JsonRpcError",
+    "IsolatedExecutor",
+    "CrashReport",
+    "ExecutionResult",
+    "ShutdownHandler",
+    "ShutdownReason",
 ]
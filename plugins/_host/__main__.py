@@ -40,44 +40,23 @@ Exit Codes:
 # ============================================
 # CRITICAL: UNBUFFERED STDOUT CONFIGURATION
 # ============================================
-# This MUST be at the very top of the file, before ANY other imports.
 # Buffered stdout causes IPC deadlocks with Tauri on Windows.
-
-import io
-import os
-import sys
-
-# Method 1: Environment variable
-os.environ["PYTHONUNBUFFERED"] = "1"
-
-# Method 2: Reconfigure stdout (Python 3.7+)
-if hasattr(sys.stdout, "reconfigure"):
-    try:
-        sys.stdout.reconfigure(line_buffering=True, write_through=True)
-    except Exception:
-        pass
-
-# Method 3: Replace stdout with unbuffered wrapper (most reliable on Windows)
-try:
-    sys.stdout = io.TextIOWrapper(
-        io.BufferedWriter(io.FileIO(sys.stdout.fileno(), mode="wb", closefd=False)),
-        encoding="utf-8",
-        line_buffering=True,
-        write_through=True,
-    )
-except Exception:
-    pass
+# `python -m plugins._host` imports the package __init__ before this module
+# runs, and _configure_unbuffered_stdout() there has already set up stdout.
+# Wrapping it again here would only add another layer to every write.
 
 # ============================================
-# STANDARD IMPORTS (AFTER UNBUFFERED CONFIG)
+# STANDARD IMPORTS
 # ============================================
 
 import argparse
 import asyncio
-import json
+import io
+import os
+import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
 
 # ============================================
 # LOCAL IMPORTS
@@ -96,7 +75,9 @@ from .isolation import IsolatedExecutor, set_executor
 from .manager import PluginManager, set_manager
 from .protocol import (
     ErrorCodes,
+    JsonRpcRequest,
     JsonRpcRouter,
+    encode_json_line,
 )
 from .shutdown import (
     ShutdownHandler,
@@ -110,12 +91,39 @@ from .shutdown import (
 
 logger = get_logger("main")
 
+# Resolved once; selects the sync read loop and SelectorEventLoop on Windows
+_IS_WIN = sys.platform == "win32"
+
+# Maximum size of a single request line on the async stdin reader.
+# The StreamReader default (64 KiB) is too small for large plugin payloads.
+STDIN_READ_LIMIT = 4 * 1024 * 1024
+
+# Maximum number of requests handled concurrently by the async read loop.
+MAX_CONCURRENT_REQUESTS = 32
+
+# Read buffer size for the synchronous (binary) stdin reader.
+STDIN_BUFFER_SIZE = 1 << 20
+
 
 # ============================================
 # JSON-RPC I/O FUNCTIONS
 # ============================================
 
 
+def _stdout_fd() -> int | None:
+    """Return the file descriptor behind sys.stdout, or None if it has none."""
+    try:
+        return sys.stdout.fileno()
+    except (AttributeError, OSError, ValueError):
+        return None
+
+
+# stdout as configured by the package __init__, and its descriptor. Responses
+# are written to the descriptor directly while sys.stdout is still this object.
+_STDOUT = sys.stdout
+_STDOUT_FD = _stdout_fd()
+
+
 def send_response(response: dict[str, Any]) -> None:
     """
     Send a JSON-RPC response to stdout.
@@ -124,14 +132,30 @@ def send_response(response: dict[str, Any]) -> None:
         response: JSON-RPC response dictionary
 
     Note:
-        Uses compact JSON (no whitespace) and explicit flush
-        for reliable IPC communication.
+        Uses compact JSON (no whitespace) written as one binary frame
+        straight to the stdout file descriptor, so nothing is left in a
+        Python-level buffer. Contract types in the result are serialized
+        via their to_dict() (see json_default).
     """
     try:
-        line = json.dumps(response, ensure_ascii=False, separators=(",", ":"))
-        sys.stdout.write(line)
-        sys.stdout.write("\n")
-        sys.stdout.flush()
+        frame = encode_json_line(response)
+        stdout = sys.stdout
+        if _STDOUT_FD is not None and stdout is _STDOUT:
+            written = os.write(_STDOUT_FD, frame)
+            if written < len(frame):
+                # Partial write (large frame on a full pipe): write the rest
+                view = memoryview(frame)[written:]
+                while view:
+                    view = view[os.write(_STDOUT_FD, view) :]
+            return
+        buffer = getattr(stdout, "buffer", None)
+        if buffer is None:
+            # stdout replaced by a text-only stream (e.g. captured in tests)
+            stdout.write(frame.decode("utf-8"))
+            stdout.flush()
+            return
+        buffer.write(frame)
+        buffer.flush()
     except Exception as e:
         logger.error(f"Failed to send response: {e}")
 
@@ -211,6 +235,42 @@ async def handle_shutdown_method(
 # ============================================
 
 
+async def dispatch_request(
+    router: JsonRpcRouter,
+    request: JsonRpcRequest,
+    shutdown_handler: ShutdownHandler,
+    dispatch_slots: asyncio.Semaphore,
+) -> None:
+    """
+    Handle one JSON-RPC request and send its response.
+
+    Runs as a task from run_read_loop. Releases its dispatch slot and
+    completes in-flight tracking when done.
+
+    Args:
+        router: JsonRpcRouter for request handling
+        request: Parsed JSON-RPC request
+        shutdown_handler: ShutdownHandler tracking in-flight requests
+        dispatch_slots: Semaphore acquired by the read loop for this request
+    """
+    try:
+        response = await router.handle_request(request)
+
+        # Send response (skip for notifications)
+        if response and not request.is_notification:
+            send_response(response.to_dict())
+
+    except Exception as e:
+        logger.exception(f"Error handling request: {e}")
+        if not request.is_notification:
+            send_error(request.id, ErrorCodes.INTERNAL_ERROR, f"Internal error: {type(e).__name__}: {str(e)}")
+    finally:
+        dispatch_slots.release()
+        # Complete request tracking
+        if request.id is not None:
+            shutdown_handler.request_completed(request.id)
+
+
 async def run_read_loop(router: JsonRpcRouter, shutdown_handler: ShutdownHandler) -> None:
     """
     Main JSON-RPC read loop.
@@ -224,10 +284,10 @@ async def run_read_loop(router: JsonRpcRouter, shutdown_handler: ShutdownHandler
     """
     logger.info("Starting JSON-RPC read loop")
 
-    loop = asyncio.get_event_loop()
+    loop = asyncio.get_running_loop()
 
     # Create a reader for stdin
-    reader = asyncio.StreamReader()
+    reader = asyncio.StreamReader(limit=STDIN_READ_LIMIT)
     protocol = asyncio.StreamReaderProtocol(reader)
 
     try:
@@ -241,16 +301,25 @@ async def run_read_loop(router: JsonRpcRouter, shutdown_handler: ShutdownHandler
 
     request_count = 0
 
+    # Resolves when shutdown is initiated (signal or shutdown method), so the
+    # loop blocks on stdin without periodic wakeups.
+    shutdown_wait = asyncio.ensure_future(shutdown_handler.shutdown_event.wait())
+    read_task: asyncio.Future[bytes] | None = None
+
+    # Requests are dispatched concurrently (responses are matched by id);
+    # the semaphore bounds how many run at once.
+    dispatch_slots = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    dispatch_tasks: set[asyncio.Task[None]] = set()
+
     while not shutdown_handler.is_shutdown_requested():
         try:
-            # Read a line from stdin with timeout
-            try:
-                line_bytes = await asyncio.wait_for(
-                    reader.readline(),
-                    timeout=1.0,  # Check shutdown flag every second
-                )
-            except TimeoutError:
-                continue
+            # Read a line from stdin, or stop as soon as shutdown is requested
+            read_task = asyncio.ensure_future(reader.readline())
+            await asyncio.wait({read_task, shutdown_wait}, return_when=asyncio.FIRST_COMPLETED)
+            if not read_task.done():
+                logger.info("Shutdown requested, exiting read loop")
+                break
+            line_bytes = read_task.result()
 
             # Check for EOF (stdin closed)
             if not line_bytes:
@@ -258,25 +327,18 @@ async def run_read_loop(router: JsonRpcRouter, shutdown_handler: ShutdownHandler
                 shutdown_handler._initiate_shutdown(ShutdownReason.EOF)
                 break
 
-            # Decode and strip
-            line = line_bytes.decode("utf-8", errors="replace").strip()
+            # Strip at the bytes level; parse_request decodes UTF-8 bytes directly
+            line = line_bytes.strip()
 
             # Skip empty lines
             if not line:
                 continue
 
             request_count += 1
-            logger.debug(f"Received request #{request_count}: {line[:100]}...")
-
-            # Parse JSON
-            try:
-                data = json.loads(line)
-            except json.JSONDecodeError as e:
-                logger.warning(f"JSON parse error: {e}")
-                send_error(None, ErrorCodes.PARSE_ERROR, f"Parse error: {e}")
-                continue
+            # Lazy %-formatting: nothing is built unless DEBUG is enabled
+            logger.debug("Received request #%d: %.100r...", request_count, line)
 
-            # Parse as JSON-RPC request
+            # Parse as JSON-RPC request (single JSON decode; reports PARSE_ERROR)
             request, error_response = router.parse_request(line)
 
             if error_response:
@@ -292,31 +354,30 @@ async def run_read_loop(router: JsonRpcRouter, shutdown_handler: ShutdownHandler
             if request.id is not None:
                 shutdown_handler.request_started(request.id)
 
-            try:
-                # Check for shutdown method (handle specially)
-                if request.method == "shutdown":
+            # Shutdown is handled inline since it ends the loop
+            if request.method == "shutdown":
+                try:
                     result = await handle_shutdown_method(
                         request.params if isinstance(request.params, dict) else {}, request.id, shutdown_handler
                     )
                     if not request.is_notification:
                         send_result(request.id, result)
-                    break  # Exit loop after shutdown
-
-                # Route to handler
-                response = await router.handle_request(request)
-
-                # Send response (skip for notifications)
-                if response and not request.is_notification:
-                    send_response(response.to_dict())
-
-            except Exception as e:
-                logger.exception(f"Error handling request: {e}")
-                if not request.is_notification:
-                    send_error(request.id, ErrorCodes.INTERNAL_ERROR, f"Internal error: {type(e).__name__}: {str(e)}")
-            finally:
-                # Complete request tracking
-                if request.id is not None:
-                    shutdown_handler.request_completed(request.id)
+                except Exception as e:
+                    logger.exception(f"Error handling request: {e}")
+                    if not request.is_notification:
+                        send_error(
+                            request.id, ErrorCodes.INTERNAL_ERROR, f"Internal error: {type(e).__name__}: {str(e)}"
+                        )
+                finally:
+                    if request.id is not None:
+                        shutdown_handler.request_completed(request.id)
+                break  # Exit loop after shutdown
+
+            # Route to handler as a task so slow methods don't block reading
+            await dispatch_slots.acquire()
+            task = asyncio.create_task(dispatch_request(router, request, shutdown_handler, dispatch_slots))
+            dispatch_tasks.add(task)
+            task.add_done_callback(dispatch_tasks.discard)
 
         except asyncio.CancelledError:
             logger.info("Read loop cancelled")
@@ -326,6 +387,10 @@ async def run_read_loop(router: JsonRpcRouter, shutdown_handler: ShutdownHandler
             logger.exception(f"Unexpected error in read loop: {e}")
             send_error(None, ErrorCodes.INTERNAL_ERROR, f"Read loop error: {e}")
 
+    if read_task is not None:
+        read_task.cancel()
+    shutdown_wait.cancel()
+
     logger.info(f"Read loop ended after {request_count} requests")
 
 
@@ -334,13 +399,28 @@ async def run_read_loop(router: JsonRpcRouter, shutdown_handler: ShutdownHandler
 # ============================================
 
 
+def _open_binary_stdin() -> BinaryIO:
+    """
+    Return a large-buffered binary reader over stdin.
+
+    Bypasses the text layer (per-line decode) and the default 8 KiB buffer.
+    Falls back to sys.stdin.buffer when there is no raw file underneath.
+    """
+    buffer = sys.stdin.buffer
+    raw = getattr(buffer, "raw", None)
+    if raw is None:
+        return buffer
+    return io.BufferedReader(raw, buffer_size=STDIN_BUFFER_SIZE)
+
+
 def run_sync_read_loop(
     router: JsonRpcRouter, shutdown_handler: ShutdownHandler, event_loop: asyncio.AbstractEventLoop | None = None
 ) -> None:
     """
     Synchronous read loop for Windows and environments without async stdin.
 
-    Uses sys.stdin directly for line-by-line reading. This is the PRIMARY
+    Reads stdin in binary mode through a large buffer and hands each line to
+    the router as bytes (no text-layer decode). This is the PRIMARY
     mode for Windows because ProactorEventLoop doesn't support connect_read_pipe
     for piped stdin.
 
@@ -350,10 +430,11 @@ def run_sync_read_loop(
         event_loop: Optional existing event loop to use for async handlers.
                    If None, creates a new loop per request.
     """
-    logger.info("Starting synchronous JSON-RPC read loop (Windows-compatible)")
-    logger.info(f"Platform: {sys.platform}")
-    logger.info(f"Event loop provided: {event_loop is not None}")
-    logger.info("Ready, waiting for requests on stdin...")
+    logger.info(
+        "Starting synchronous JSON-RPC read loop (Windows-compatible): platform=%s, event loop provided=%s",
+        sys.platform,
+        event_loop is not None,
+    )
 
     request_count = 0
 
@@ -367,7 +448,9 @@ def run_sync_read_loop(
         logger.debug("Created new event loop for sync mode")
 
     try:
-        for line in sys.stdin:
+        stdin = _open_binary_stdin()
+
+        for line in iter(stdin.readline, b""):
             # Check shutdown
             if shutdown_handler.is_shutdown_requested():
                 logger.info("Shutdown requested, exiting read loop")
@@ -380,17 +463,10 @@ def run_sync_read_loop(
                 continue
 
             request_count += 1
-            logger.debug(f"Received request #{request_count}: {line[:100]}...")
+            # Lazy %-formatting: nothing is built unless DEBUG is enabled
+            logger.debug("Received request #%d: %.100r...", request_count, line)
 
-            # Parse JSON
-            try:
-                data = json.loads(line)
-            except json.JSONDecodeError as e:
-                logger.warning(f"JSON parse error: {e}")
-                send_error(None, ErrorCodes.PARSE_ERROR, f"Parse error: {e}")
-                continue
-
-            # Parse as JSON-RPC request
+            # Parse as JSON-RPC request (single JSON decode; reports PARSE_ERROR)
             request, error_response = router.parse_request(line)
 
             if error_response:
@@ -403,7 +479,7 @@ def run_sync_read_loop(
                 send_error(None, ErrorCodes.INVALID_REQUEST, "Invalid request")
                 continue
 
-            logger.debug(f"Processing method: {request.method} (id={request.id})")
+            logger.debug("Processing method: %s (id=%s)", request.method, request.id)
 
             # Track request
             if request.id is not None:
@@ -422,13 +498,16 @@ def run_sync_read_loop(
                     shutdown_handler._initiate_shutdown(ShutdownReason.REQUESTED)
                     break
 
-                # Route to handler using the event loop
-                # Use run_until_complete which is safe for sync context
-                response = event_loop.run_until_complete(router.handle_request(request))
+                # Route to handler: synchronous handlers are called directly;
+                # async ones run on the event loop (run_until_complete is safe here)
+                if router.is_sync_handler(request.method):
+                    response = router.call_sync(request)
+                else:
+                    response = event_loop.run_until_complete(router.handle_request(request))
 
                 # Send response
                 if response and not request.is_notification:
-                    logger.debug(f"Sending response for id={request.id}")
+                    logger.debug("Sending response for id=%s", request.id)
                     send_response(response.to_dict())
 
             except Exception as e:
@@ -468,6 +547,42 @@ def run_sync_read_loop(
 # ============================================
 
 
+def resolve_host_directories(args: argparse.Namespace) -> tuple[Path, Path] | None:
+    """
+    Resolve the plugins and config directories from the command line.
+
+    Uses strict resolution so the existence check and the path walk are a
+    single pass. A missing config directory is created. Paths that cannot be
+    resolved (missing, running through a regular file, or a symlink loop)
+    count as not found.
+
+    Args:
+        args: Parsed command-line arguments
+
+    Returns:
+        (plugins_dir, config_dir), or None if the plugins directory is missing
+        (an error has already been reported)
+    """
+    # resolve() raises OSError for missing/non-directory components and
+    # RuntimeError for symlink loops; abspath() never touches the filesystem
+    try:
+        plugins_dir = Path(args.plugins_dir).resolve(strict=True)
+    except (OSError, RuntimeError):
+        plugins_dir = Path(os.path.abspath(args.plugins_dir))
+        logger.error(f"Plugins directory not found: {plugins_dir}")
+        send_error(None, ErrorCodes.INTERNAL_ERROR, f"Plugins directory not found: {plugins_dir}")
+        return None
+
+    try:
+        config_dir = Path(args.config_dir).resolve(strict=True)
+    except (OSError, RuntimeError):
+        config_dir = Path(os.path.abspath(args.config_dir))
+        logger.warning(f"Config directory not found: {config_dir}, creating...")
+        config_dir.mkdir(parents=True, exist_ok=True)
+
+    return plugins_dir, config_dir
+
+
 async def async_main(args: argparse.Namespace) -> int:
     """
     Async main function.
@@ -485,19 +600,11 @@ async def async_main(args: argparse.Namespace) -> int:
     logger.info(f"Plugins directory: {args.plugins_dir}")
     logger.info(f"Config directory: {args.config_dir}")
 
-    # Resolve paths
-    plugins_dir = Path(args.plugins_dir).resolve()
-    config_dir = Path(args.config_dir).resolve()
-
-    # Validate directories exist
-    if not plugins_dir.exists():
-        logger.error(f"Plugins directory not found: {plugins_dir}")
-        send_error(None, ErrorCodes.INTERNAL_ERROR, f"Plugins directory not found: {plugins_dir}")
+    # Resolve and validate directories
+    directories = resolve_host_directories(args)
+    if directories is None:
         return 1
-
-    if not config_dir.exists():
-        logger.warning(f"Config directory not found: {config_dir}, creating...")
-        config_dir.mkdir(parents=True, exist_ok=True)
+    plugins_dir, config_dir = directories
 
     # Initialize components
     logger.info("Initializing plugin infrastructure...")
@@ -514,7 +621,7 @@ async def async_main(args: argparse.Namespace) -> int:
     await manager.start()
 
     # Create shutdown handler
-    loop = asyncio.get_event_loop()
+    loop = asyncio.get_running_loop()
     shutdown_handler = create_shutdown_handler(manager=manager, install_signals=True, loop=loop)
 
     # Create JSON-RPC router
@@ -583,23 +690,17 @@ def sync_main(args: argparse.Namespace) -> int:
     logger.info(f"Plugins directory: {args.plugins_dir}")
     logger.info(f"Config directory: {args.config_dir}")
 
-    # Resolve paths
-    plugins_dir = Path(args.plugins_dir).resolve()
-    config_dir = Path(args.config_dir).resolve()
-
-    # Validate directories exist
-    if not plugins_dir.exists():
-        logger.error(f"Plugins directory not found: {plugins_dir}")
-        send_error(None, ErrorCodes.INTERNAL_ERROR, f"Plugins directory not found: {plugins_dir}")
+    # Resolve and validate directories
+    directories = resolve_host_directories(args)
+    if directories is None:
         return 1
-
-    if not config_dir.exists():
-        logger.warning(f"Config directory not found: {config_dir}, creating...")
-        config_dir.mkdir(parents=True, exist_ok=True)
+    plugins_dir, config_dir = directories
 
     # Create event loop for async operations
-    # On Windows, use SelectorEventLoop for compatibility (not Proactor)
-    if sys.platform == "win32":
+    # On Windows, use SelectorEventLoop for compatibility (not Proactor).
+    # Declared up front: _IS_WIN doesn't give mypy the sys.platform narrowing.
+    loop: asyncio.AbstractEventLoop
+    if _IS_WIN:
         # SelectorEventLoop works better for our use case
         loop = asyncio.SelectorEventLoop()
     else:
@@ -733,9 +834,10 @@ def main() -> int:
     args = parser.parse_args()
 
     # Determine mode: Windows requires sync mode unless force-async is set
-    use_sync_mode = args.sync_mode or (sys.platform == "win32" and not args.force_async)
+    windows_sync = _IS_WIN and not args.force_async
+    use_sync_mode = args.sync_mode or windows_sync
 
-    if sys.platform == "win32" and not args.force_async:
+    if windows_sync:
         # Log why we're using sync mode
         # (Can't use logger yet - not configured)
         pass
@@ -19,21 +19,29 @@ This module is imported by:
     - D024: manager.py
 """
 
+import copy
+import functools
 import json
 import logging
+import os
 import re
 import sys
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
-import yaml
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 # Configure logging to stderr (NOT stdout - stdout is for JSON-RPC)
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class DiscoveredPlugin:
     """
     Represents a discovered plugin before loading.
@@ -46,7 +54,7 @@ class DiscoveredPlugin:
         version: Plugin version from manifest
         entry_point: Python module name to import
         valid: Whether manifest passed initial validation
-        errors: List of validation errors if not valid
+        errors: Validation errors if not valid (empty tuple when valid)
     """
 
     path: Path
@@ -56,7 +64,7 @@ class DiscoveredPlugin:
     version: str
     entry_point: str
     valid: bool = True
-    errors: list[str] = field(default_factory=list)
+    errors: tuple[str, ...] = ()
 
     def to_dict(self) -> dict[str, Any]:
         """Serialize for JSON-RPC responses."""
@@ -68,10 +76,41 @@ class DiscoveredPlugin:
             "version": self.version,
             "entry_point": self.entry_point,
             "valid": self.valid,
-            "errors": self.errors,
+            "errors": list(self.errors),
         }
 
 
+# Fields every manifest.json must define (full schema validation is in D022)
+_REQUIRED_MANIFEST_FIELDS = ("name", "version", "contract", "entry_point")
+_REQUIRED_MANIFEST_FIELDS_SET = frozenset(_REQUIRED_MANIFEST_FIELDS)
+
+
+@functools.lru_cache(maxsize=8)
+def _read_prefixes_file(path: str, mtime_ns: int, size: int) -> dict[str, dict[str, Any]]:
+    """
+    Parse the prefixes mapping from contract_prefixes.yaml.
+
+    Cached on (path, mtime, size), so the file is re-parsed only after it changes.
+    Uses the libyaml-backed CSafeLoader when PyYAML was built with it.
+    """
+    # Deferred: PyYAML costs ~12 ms to import and is only needed here
+    import yaml
+
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    with open(path, encoding="utf-8") as f:
+        config = yaml.load(f, Loader=loader)
+    # An empty file parses to None
+    prefixes: dict[str, dict[str, Any]] = (config or {}).get("prefixes", {})
+    return prefixes
+
+
+@functools.lru_cache(maxsize=8)
+def _compile_prefix_pattern(prefixes: tuple[str, ...]) -> re.Pattern[str]:
+    """Compile the plugin folder-name pattern for a set of contract prefixes."""
+    prefix_list = "|".join(prefixes)
+    return re.compile(rf"^({prefix_list})_[a-z0-9_]+_plugin$")
+
+
 class HybridDiscovery:
     """
     Hybrid plugin discovery system combining:
@@ -104,7 +143,7 @@ class HybridDiscovery:
 
         # Load valid prefixes from config
         self._prefixes: dict[str, dict[str, Any]] = {}
-        self._prefix_pattern: re.Pattern | None = None
+        self._prefix_pattern: re.Pattern[str] | None = None
         self._load_prefixes()
 
         logger.debug(f"HybridDiscovery initialized: plugins={self.plugins_dir}")
@@ -119,7 +158,9 @@ class HybridDiscovery:
         """
         prefixes_path = self.config_dir / "contract_prefixes.yaml"
 
-        if not prefixes_path.exists():
+        try:
+            stat = os.stat(prefixes_path)
+        except FileNotFoundError:
             logger.warning(f"contract_prefixes.yaml not found at {prefixes_path}")
             # Default prefixes if config missing
             self._prefixes = {
@@ -128,20 +169,20 @@ class HybridDiscovery:
                 "llm": {"contract": "llm_contract", "description": "LLM plugins"},
             }
         else:
-            with open(prefixes_path, encoding="utf-8") as f:
-                config = yaml.safe_load(f)
-                self._prefixes = config.get("prefixes", {})
+            # Parsed once per file version; deep-copy so neither instances nor the
+            # lru_cache entry share the nested per-prefix dicts
+            self._prefixes = copy.deepcopy(_read_prefixes_file(str(prefixes_path), stat.st_mtime_ns, stat.st_size))
 
-        # Build regex pattern from prefixes
-        prefix_list = "|".join(self._prefixes.keys())
-        self._prefix_pattern = re.compile(rf"^({prefix_list})_[a-z0-9_]+_plugin$")
+        # Build regex pattern from prefixes (shared across instances)
+        self._prefix_pattern = _compile_prefix_pattern(tuple(self._prefixes))
+        self._valid_prefixes = frozenset(self._prefixes)
 
         logger.debug(f"Loaded {len(self._prefixes)} valid prefixes: {list(self._prefixes.keys())}")
 
     @property
-    def valid_prefixes(self) -> set[str]:
-        """Get set of valid contract prefixes."""
-        return set(self._prefixes.keys())
+    def valid_prefixes(self) -> frozenset[str]:
+        """Get set of valid contract prefixes (built once when prefixes load)."""
+        return self._valid_prefixes
 
     def get_prefix_info(self, prefix: str) -> dict[str, Any] | None:
         """
@@ -198,29 +239,31 @@ class HybridDiscovery:
             Tuple of (manifest_dict, errors)
         """
         manifest_path = plugin_path / "manifest.json"
-        errors = []
-
-        if not manifest_path.exists():
-            return None, [f"manifest.json not found in {plugin_path}"]
 
+        # Open directly rather than checking exists() first (one stat fewer)
         try:
-            with open(manifest_path, encoding="utf-8") as f:
-                manifest = json.load(f)
+            with open(manifest_path, "rb") as f:
+                raw = f.read()
+            # Both parsers take UTF-8 bytes directly; orjson.JSONDecodeError
+            # subclasses json.JSONDecodeError
+            manifest = orjson.loads(raw) if HAS_ORJSON else json.loads(raw)
+        except FileNotFoundError:
+            return None, [f"manifest.json not found in {plugin_path}"]
         except json.JSONDecodeError as e:
             return None, [f"Invalid JSON in manifest.json: {e}"]
         except Exception as e:
             return None, [f"Error reading manifest.json: {e}"]
 
         # Validate required fields (basic validation, D022 does full schema validation)
-        required_fields = ["name", "version", "contract", "entry_point"]
-        for field in required_fields:
-            if field not in manifest:
-                errors.append(f"Missing required field '{field}' in manifest.json")
+        if manifest.keys() >= _REQUIRED_MANIFEST_FIELDS_SET:
+            return manifest, []
 
-        if errors:
-            return manifest, errors
-
-        return manifest, []
+        errors = [
+            f"Missing required field '{name}' in manifest.json"
+            for name in _REQUIRED_MANIFEST_FIELDS
+            if name not in manifest
+        ]
+        return manifest, errors
 
     def discover_plugin(self, plugin_path: Path) -> DiscoveredPlugin:
         """
@@ -253,7 +296,7 @@ class HybridDiscovery:
                 version="0.0.0",
                 entry_point="plugin",
                 valid=False,
-                errors=all_errors,
+                errors=tuple(all_errors),
             )
 
         # Extract fields from manifest
@@ -271,7 +314,7 @@ class HybridDiscovery:
             all_errors.append(f"Folder prefix '{prefix}' does not match manifest contract '{contract}'")
 
         # Validate contract is known
-        if contract not in self._prefixes:
+        if contract not in self._valid_prefixes:
             all_errors.append(
                 f"Unknown contract type '{contract}'. Valid types: {', '.join(sorted(self._prefixes.keys()))}"
             )
@@ -288,8 +331,8 @@ class HybridDiscovery:
             name=name,
             version=version,
             entry_point=entry_point,
-            valid=len(all_errors) == 0,
-            errors=all_errors,
+            valid=not all_errors,
+            errors=tuple(all_errors),
         )
 
     def scan(self, include_invalid: bool = False) -> list[DiscoveredPlugin]:
@@ -299,30 +342,44 @@ class HybridDiscovery:
         Args:
             include_invalid: If True, include plugins that failed validation
 
+        Returns:
+            List of DiscoveredPlugin objects
+        """
+        return self._scan(include_invalid)
+
+    def _scan(self, include_invalid: bool, folder_prefix: str = "") -> list[DiscoveredPlugin]:
+        """
+        Scan plugin folders, optionally only those whose name starts with folder_prefix.
+
+        Args:
+            include_invalid: If True, include plugins that failed validation
+            folder_prefix: Skip folders not starting with this (before reading manifests)
+
         Returns:
             List of DiscoveredPlugin objects
         """
         discovered: list[DiscoveredPlugin] = []
 
-        if not self.plugins_dir.exists():
+        # Single scandir pass: entry.is_dir() uses the dirent type, no stat per folder
+        try:
+            entries = os.scandir(self.plugins_dir)
+        except FileNotFoundError:
             logger.warning(f"Plugins directory does not exist: {self.plugins_dir}")
             return discovered
-
-        if not self.plugins_dir.is_dir():
+        except NotADirectoryError:
             logger.error(f"Plugins path is not a directory: {self.plugins_dir}")
             return discovered
 
-        # Scan each subfolder
-        for item in self.plugins_dir.iterdir():
-            # Skip files, hidden folders, and special folders
-            if not item.is_dir():
-                continue
-            if item.name.startswith("."):
-                continue
-            if item.name.startswith("_"):
-                # Skip _host and other special folders
-                continue
+        with entries:
+            # Skip hidden folders and special folders (_host etc.) before touching the entry
+            plugin_dirs = [
+                Path(entry.path)
+                for entry in entries
+                if entry.name.startswith(folder_prefix) and not entry.name.startswith((".", "_")) and entry.is_dir()
+            ]
 
+        # Scan each subfolder
+        for item in plugin_dirs:
             plugin = self.discover_plugin(item)
 
             if plugin.valid or include_invalid:
@@ -347,7 +404,11 @@ class HybridDiscovery:
         Returns:
             List of DiscoveredPlugin objects matching the contract
         """
-        all_plugins = self.scan(include_invalid=include_invalid)
+        # A valid plugin's folder always starts with "<contract>_", so other
+        # folders can be skipped without reading their manifests. Invalid
+        # plugins may live in any folder, so they need the full scan.
+        folder_prefix = "" if include_invalid else f"{contract}_"
+        all_plugins = self._scan(include_invalid, folder_prefix)
         return [p for p in all_plugins if p.contract == contract]
 
     def find_plugin(self, name: str) -> DiscoveredPlugin | None:
@@ -359,6 +420,10 @@ class HybridDiscovery:
 
         Returns:
             DiscoveredPlugin if found, None otherwise
+
+        Note:
+            Not cached: each call re-reads manifest.json, so callers always get
+            a fresh DiscoveredPlugin they are free to modify.
         """
         plugin_path = self.plugins_dir / name
         if not plugin_path.exists():
@@ -374,9 +439,9 @@ class HybridDiscovery:
         """
         summary: dict[str, list[str]] = {prefix: [] for prefix in self._prefixes}
 
+        # Valid plugins always have a known contract, so every key already exists
         for plugin in self.scan(include_invalid=False):
-            if plugin.contract in summary:
-                summary[plugin.contract].append(plugin.name)
+            summary[plugin.contract].append(plugin.name)
 
         return summary
 
@@ -395,11 +460,22 @@ def discover_plugins(
 
     Returns:
         List of DiscoveredPlugin objects
+
+    Note:
+        The HybridDiscovery (and its parsed prefixes) is reused across calls
+        for the same directories. Construct a HybridDiscovery directly to pick
+        up edits to contract_prefixes.yaml.
     """
-    discovery = HybridDiscovery(plugins_dir, config_dir)
+    discovery = _get_discovery(str(Path(plugins_dir).resolve()), str(Path(config_dir).resolve()))
     return discovery.scan(include_invalid=include_invalid)
 
 
+@functools.lru_cache(maxsize=8)
+def _get_discovery(plugins_dir: str, config_dir: str) -> HybridDiscovery:
+    """Return a shared HybridDiscovery for resolved plugins/config directories."""
+    return HybridDiscovery(plugins_dir, config_dir)
+
+
 # Entry point for testing
 if __name__ == "__main__":
     # Configure logging for testing
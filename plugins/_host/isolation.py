@@ -26,10 +26,12 @@ Key Responsibilities:
 
 import asyncio
 import functools
+import itertools
 import logging
+import math
 import time
 import traceback
-from collections import defaultdict
+from collections import defaultdict, deque
 from collections.abc import Callable, Coroutine
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -62,7 +64,22 @@ class ErrorCode:
     PLUGIN_CRASHED = -32062
 
 
-@dataclass
+# Substrings that mark a parameter name as sensitive (matched case-insensitively)
+_SENSITIVE_KEY_PARTS = ("password", "secret", "key", "token", "auth")
+
+
+def _is_sensitive_key(key: str) -> bool:
+    """Return True if a parameter name looks like it holds a credential."""
+    # Lowercase once and use plain substring tests; measured faster than an
+    # any() generator or an IGNORECASE regex for typical parameter names
+    lowered = key.lower()
+    for part in _SENSITIVE_KEY_PARTS:
+        if part in lowered:
+            return True
+    return False
+
+
+@dataclass(slots=True)
 class CrashReport:
     """
     Detailed crash report for a plugin exception.
@@ -75,13 +92,14 @@ class CrashReport:
         method: Method that was called when crash occurred
         exception_type: Type name of the exception
         exception_message: Exception message string
-        traceback: Full stack trace as string
+        traceback: Full stack trace as string (empty if the crash log was rate-limited)
         timestamp: When the crash occurred
         call_id: JSON-RPC request ID (if available)
         params: Parameters passed to the method (sanitized)
         context: Additional context for debugging
         recovery_attempted: Whether recovery was attempted
         recovery_success: Whether recovery succeeded
+        exception: Original exception, kept only until the traceback is formatted
     """
 
     plugin_name: str
@@ -95,6 +113,7 @@ class CrashReport:
     context: dict[str, Any] = field(default_factory=dict)
     recovery_attempted: bool = False
     recovery_success: bool = False
+    exception: BaseException | None = field(default=None, repr=False, compare=False)
 
     def to_dict(self) -> dict[str, Any]:
         """Serialize for JSON-RPC responses."""
@@ -126,17 +145,22 @@ class CrashReport:
 
     def log_full_report(self, log: logging.Logger) -> None:
         """Log full crash report including traceback for debugging."""
-        log.error("Plugin Crash Report")
-        log.error(f"  Plugin: {self.plugin_name}")
-        log.error(f"  Method: {self.method}")
-        log.error(f"  Exception: {self.exception_type}: {self.exception_message}")
-        log.error(f"  Timestamp: {self.timestamp.isoformat()}")
+        # One record per crash: a single handler lock/write, and the report
+        # can't be interleaved with other log lines
+        lines = [
+            "Plugin Crash Report",
+            f"  Plugin: {self.plugin_name}",
+            f"  Method: {self.method}",
+            f"  Exception: {self.exception_type}: {self.exception_message}",
+            f"  Timestamp: {self.timestamp.isoformat()}",
+        ]
         if self.call_id:
-            log.error(f"  Request ID: {self.call_id}")
-        log.error(f"  Traceback:\n{self.traceback}")
+            lines.append(f"  Request ID: {self.call_id}")
+        lines.append(f"  Traceback:\n{self.traceback}")
+        log.error("\n".join(lines))
 
 
-@dataclass
+@dataclass(slots=True)
 class ExecutionResult:
     """
     Result of an isolated execution attempt.
@@ -159,6 +183,11 @@ class ExecutionResult:
     crash_report: CrashReport | None = None
     execution_time_ms: float = 0.0
 
+    @classmethod
+    def ok(cls, result: Any, execution_time_ms: float) -> "ExecutionResult":
+        """Create a successful result."""
+        return cls(success=True, result=result, execution_time_ms=execution_time_ms)
+
     def to_json_rpc_error(self) -> dict[str, Any]:
         """Convert to JSON-RPC error object."""
         error = {
@@ -175,7 +204,9 @@ class CrashRateLimiter:
     Rate limiter for crash logging and notifications.
 
     Prevents log flooding when a plugin crashes repeatedly.
-    Uses a sliding window to track crash frequency.
+    Uses a sliding window to track crash frequency. Times come from
+    time.monotonic(), so wall-clock adjustments can't stretch or shrink
+    the window.
     """
 
     def __init__(self, window_seconds: float = 60.0, max_reports: int = 5):
@@ -188,47 +219,58 @@ class CrashRateLimiter:
         """
         self.window_seconds = window_seconds
         self.max_reports = max_reports
-        self._crash_times: dict[str, list[float]] = defaultdict(list)
-        self._suppressed_counts: dict[str, int] = defaultdict(int)
+        # Per-plugin crash timestamps, oldest first; expired entries are popped from the left.
+        # Plain dicts so read-only queries don't insert entries for unknown plugins.
+        self._crash_times: dict[str, deque[float]] = {}
+        self._suppressed_counts: dict[str, int] = {}
+
+    def _prune(self, times: deque[float], now: float) -> deque[float]:
+        """Drop crash timestamps that have left the window and return the remaining ones."""
+        cutoff = now - self.window_seconds
+        while times and times[0] <= cutoff:
+            times.popleft()
+        return times
 
-    def should_report(self, plugin_name: str) -> bool:
+    def should_report(self, plugin_name: str, now: float | None = None) -> bool:
         """
         Check if a crash should be reported for a plugin.
 
         Args:
             plugin_name: Name of the crashed plugin
+            now: time.monotonic() reading to use (read here if not given)
 
         Returns:
             True if crash should be logged, False if rate-limited
         """
-        now = time.time()
-        cutoff = now - self.window_seconds
+        if now is None:
+            now = time.monotonic()
 
-        # Clean old entries
-        self._crash_times[plugin_name] = [t for t in self._crash_times[plugin_name] if t > cutoff]
+        times = self._crash_times.get(plugin_name)
+        if times is None:
+            times = self._crash_times[plugin_name] = deque()
+        else:
+            self._prune(times, now)
 
         # Check if under limit
-        if len(self._crash_times[plugin_name]) < self.max_reports:
-            self._crash_times[plugin_name].append(now)
+        if len(times) < self.max_reports:
+            times.append(now)
 
             # Log suppressed count if resuming reporting
-            if self._suppressed_counts[plugin_name] > 0:
-                logger.warning(
-                    f"Plugin {plugin_name}: {self._suppressed_counts[plugin_name]} "
-                    f"crashes suppressed in last {self.window_seconds}s"
-                )
-                self._suppressed_counts[plugin_name] = 0
+            suppressed = self._suppressed_counts.pop(plugin_name, 0)
+            if suppressed > 0:
+                logger.warning(f"Plugin {plugin_name}: {suppressed} crashes suppressed in last {self.window_seconds}s")
 
             return True
         else:
-            self._suppressed_counts[plugin_name] += 1
+            self._suppressed_counts[plugin_name] = self._suppressed_counts.get(plugin_name, 0) + 1
             return False
 
-    def get_crash_count(self, plugin_name: str) -> int:
+    def get_crash_count(self, plugin_name: str, now: float | None = None) -> int:
         """Get number of crashes in current window for a plugin."""
-        now = time.time()
-        cutoff = now - self.window_seconds
-        return len([t for t in self._crash_times[plugin_name] if t > cutoff])
+        times = self._crash_times.get(plugin_name)
+        if times is None:
+            return 0
+        return len(self._prune(times, time.monotonic() if now is None else now))
 
 
 class IsolatedExecutor:
@@ -266,7 +308,7 @@ class IsolatedExecutor:
 
     def __init__(
         self,
-        default_timeout: float = 30.0,
+        default_timeout: float | None = 30.0,
         crash_rate_window: float = 60.0,
         crash_rate_limit: int = 5,
         max_crash_history: int = 100,
@@ -275,7 +317,7 @@ class IsolatedExecutor:
         Initialize isolated executor.
 
         Args:
-            default_timeout: Default timeout for plugin calls (seconds)
+            default_timeout: Default timeout for plugin calls (seconds; None or math.inf disables it)
             crash_rate_window: Time window for rate limiting (seconds)
             crash_rate_limit: Max crashes per window before limiting
             max_crash_history: Maximum crash reports to keep in history
@@ -283,8 +325,8 @@ class IsolatedExecutor:
         self.default_timeout = default_timeout
         self.rate_limiter = CrashRateLimiter(window_seconds=crash_rate_window, max_reports=crash_rate_limit)
 
-        # Crash history (ring buffer)
-        self._crash_history: list[CrashReport] = []
+        # Crash history (ring buffer; the deque drops the oldest report when full)
+        self._crash_history: deque[CrashReport] = deque(maxlen=max_crash_history)
         self._max_crash_history = max_crash_history
 
         # Plugin crash counts for health monitoring
@@ -302,11 +344,10 @@ class IsolatedExecutor:
         Truncates large values and masks sensitive fields.
         """
         sanitized = {}
-        sensitive_keys = {"password", "secret", "key", "token", "auth"}
 
         for key, value in params.items():
             # Mask sensitive values
-            if any(s in key.lower() for s in sensitive_keys):
+            if _is_sensitive_key(key):
                 sanitized[key] = "***MASKED***"
             # Truncate large strings
             elif isinstance(value, str) and len(value) > 200:
@@ -336,23 +377,28 @@ class IsolatedExecutor:
             method=method,
             exception_type=type(exception).__name__,
             exception_message=str(exception),
-            traceback=traceback.format_exc(),
+            # Formatted in _record_crash, and only if the report is logged
+            traceback="",
             call_id=call_id,
             params=self._sanitize_params(params) if params else None,
+            exception=exception,
         )
 
     def _record_crash(self, report: CrashReport) -> None:
         """Record a crash in history."""
         # Add to history (ring buffer)
         self._crash_history.append(report)
-        if len(self._crash_history) > self._max_crash_history:
-            self._crash_history.pop(0)
 
         # Increment crash count
         self._crash_counts[report.plugin_name] += 1
 
-        # Log if not rate-limited
+        # Drop the exception so history doesn't keep its frames alive
+        exception, report.exception = report.exception, None
+
+        # Log if not rate-limited; suppressed crashes skip traceback formatting
         if self.rate_limiter.should_report(report.plugin_name):
+            if exception is not None:
+                report.traceback = "".join(traceback.format_exception(exception))
             report.log_full_report(logger)
         else:
             logger.debug(f"Crash report suppressed for {report.plugin_name} (rate limited)")
@@ -391,7 +437,7 @@ class IsolatedExecutor:
             callable: Async callable to execute
             args: Positional arguments
             kwargs: Keyword arguments
-            timeout_seconds: Timeout (uses default if not specified)
+            timeout_seconds: Timeout (uses default if not specified; math.inf disables it)
             call_id: JSON-RPC request ID for crash reports
 
         Returns:
@@ -400,16 +446,23 @@ class IsolatedExecutor:
         args = args or ()
         kwargs = kwargs or {}
         timeout = timeout_seconds or self.default_timeout
+        if timeout == math.inf:
+            timeout = None
 
         start_time = time.perf_counter()
 
         try:
-            # Execute with timeout
-            result = await asyncio.wait_for(callable(*args, **kwargs), timeout=timeout)
+            # asyncio.timeout() runs the call in this task, whereas wait_for()
+            # wraps it in a new one; with no timeout, skip the context entirely
+            if timeout is None:
+                result = await callable(*args, **kwargs)
+            else:
+                async with asyncio.timeout(timeout):
+                    result = await callable(*args, **kwargs)
 
             execution_time = (time.perf_counter() - start_time) * 1000
 
-            return ExecutionResult(success=True, result=result, execution_time_ms=execution_time)
+            return ExecutionResult.ok(result, execution_time)
 
         except TimeoutError:
             execution_time = (time.perf_counter() - start_time) * 1000
@@ -447,7 +500,8 @@ class IsolatedExecutor:
             return ExecutionResult(
                 success=False,
                 error_code=self._exception_to_error_code(e),
-                error_message=f"Plugin exception: {type(e).__name__}: {str(e)}",
+                # Reuse the report's strings rather than formatting the exception again
+                error_message=f"Plugin exception: {report.exception_type}: {report.exception_message}",
                 error_data=report.to_error_data(),
                 crash_report=report,
                 execution_time_ms=execution_time,
@@ -485,7 +539,7 @@ class IsolatedExecutor:
             result = callable(*args, **kwargs)
             execution_time = (time.perf_counter() - start_time) * 1000
 
-            return ExecutionResult(success=True, result=result, execution_time_ms=execution_time)
+            return ExecutionResult.ok(result, execution_time)
 
         except Exception as e:
             execution_time = (time.perf_counter() - start_time) * 1000
@@ -499,7 +553,8 @@ class IsolatedExecutor:
             return ExecutionResult(
                 success=False,
                 error_code=self._exception_to_error_code(e),
-                error_message=f"Plugin exception: {type(e).__name__}: {str(e)}",
+                # Reuse the report's strings rather than formatting the exception again
+                error_message=f"Plugin exception: {report.exception_type}: {report.exception_message}",
                 error_data=report.to_error_data(),
                 crash_report=report,
                 execution_time_ms=execution_time,
@@ -516,13 +571,13 @@ class IsolatedExecutor:
         Returns:
             List of CrashReport objects, newest first
         """
-        reports = self._crash_history
+        # Walk newest first and stop once limit reports are collected
+        reports = reversed(self._crash_history)
 
         if plugin_name:
-            reports = [r for r in reports if r.plugin_name == plugin_name]
+            reports = (r for r in reports if r.plugin_name == plugin_name)
 
-        # Return newest first
-        return list(reversed(reports[-limit:]))
+        return list(itertools.islice(reports, max(limit, 0)))
 
     def get_crash_count(self, plugin_name: str) -> int:
         """Get total crash count for a plugin."""
@@ -539,16 +594,15 @@ class IsolatedExecutor:
         now = time.time()
         cutoff = datetime.fromtimestamp(now - recent_window)
 
-        recent_crashes = [r for r in self._crash_history if r.timestamp > cutoff]
-
-        # Group by plugin
+        # Count recent crashes per plugin in one pass over the history
         by_plugin: dict[str, int] = defaultdict(int)
-        for r in recent_crashes:
-            by_plugin[r.plugin_name] += 1
+        for r in self._crash_history:
+            if r.timestamp > cutoff:
+                by_plugin[r.plugin_name] += 1
 
         return {
             "total_crashes": sum(self._crash_counts.values()),
-            "crashes_last_5min": len(recent_crashes),
+            "crashes_last_5min": sum(by_plugin.values()),
             "crashes_by_plugin": dict(self._crash_counts),
             "recent_by_plugin": dict(by_plugin),
             "history_size": len(self._crash_history),
@@ -566,7 +620,9 @@ class IsolatedExecutor:
         """
         if plugin_name:
             before = len(self._crash_history)
-            self._crash_history = [r for r in self._crash_history if r.plugin_name != plugin_name]
+            self._crash_history = deque(
+                (r for r in self._crash_history if r.plugin_name != plugin_name), maxlen=self._max_crash_history
+            )
             self._crash_counts[plugin_name] = 0
             return before - len(self._crash_history)
         else:
@@ -592,6 +648,8 @@ def isolated(timeout: float | None = None, executor: IsolatedExecutor | None = N
     """
 
     def decorator(func: Callable) -> Callable:
+        method_name = func.__name__
+
         @functools.wraps(func)
         async def wrapper(self, *args, **kwargs):
             exec_instance = executor or getattr(self, "_executor", None)
@@ -601,13 +659,17 @@ def isolated(timeout: float | None = None, executor: IsolatedExecutor | None = N
                 try:
                     return await func(self, *args, **kwargs)
                 except Exception as e:
-                    logger.error(f"Plugin method {func.__name__} failed: {e}")
+                    logger.error(f"Plugin method {method_name} failed: {e}")
                     raise
 
+            # Pass func and its arguments straight through (no per-call closure);
+            # this also lets crash reports include the sanitized kwargs
             result = await exec_instance.execute(
                 plugin_name=getattr(self, "name", "unknown"),
-                method=func.__name__,
-                callable=lambda: func(self, *args, **kwargs),
+                method=method_name,
+                callable=func,
+                args=(self, *args),
+                kwargs=kwargs,
                 timeout_seconds=timeout,
             )
 
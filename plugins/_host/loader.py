@@ -19,6 +19,8 @@ import importlib
 import importlib.util
 import inspect
 import logging
+import os
+import re
 import subprocess
 import sys
 from dataclasses import dataclass, field
@@ -35,6 +37,17 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Leading distribution name of a pip requirement string, e.g. "torch" in
+# "torch>=2.0.0", "package" in "package[extra]~=1.0; python_version>'3.8'"
+_REQUIREMENT_NAME_RE = re.compile(r"\s*([A-Za-z0-9_.\-]+)")
+
+# Module names already found to be importable in this process. Only hits are
+# cached: a missing module may be installed later, an installed one stays.
+_found_modules: set[str] = set()
+
+# Requirement strings pip has already installed successfully in this process
+_installed_requirements: set[str] = set()
+
 
 @dataclass
 class LoadedPlugin:
@@ -130,14 +143,28 @@ class PluginLoader:
         for dep in dependencies:
             # Parse package name from requirement string
             # e.g., "torch>=2.0.0" -> "torch"
-            package_name = dep.split(">=")[0].split("<=")[0].split("==")[0].split("<")[0].split(">")[0].strip()
-            package_name = package_name.split("[")[0]  # Handle extras like "package[extra]"
+            match = _REQUIREMENT_NAME_RE.match(dep)
+            if match is None:
+                missing.append(dep)
+                continue
 
-            try:
-                importlib.import_module(package_name.replace("-", "_"))
+            module_name = match.group(1).replace("-", "_")
+            if module_name in _found_modules:
                 installed.append(dep)
-            except ImportError:
+                continue
+
+            # find_spec locates the module without executing it (no heavy
+            # package init just to answer "is it installed?")
+            try:
+                spec = importlib.util.find_spec(module_name)
+            except (ImportError, ValueError):
+                spec = None
+
+            if spec is None:
                 missing.append(dep)
+            else:
+                _found_modules.add(module_name)
+                installed.append(dep)
 
         return installed, missing
 
@@ -151,12 +178,15 @@ class PluginLoader:
         Returns:
             True if installation successful
         """
-        if not dependencies:
+        # Drop repeats and requirements an earlier call already installed, so
+        # plugins sharing dependencies don't each pay for a pip run
+        pending = [dep for dep in dict.fromkeys(dependencies) if dep not in _installed_requirements]
+        if not pending:
             return True
 
         try:
-            cmd = [self.pip_executable, "install"] + dependencies
-            logger.info(f"Installing dependencies: {' '.join(dependencies)}")
+            cmd = [self.pip_executable, "install"] + pending
+            logger.info(f"Installing dependencies: {' '.join(pending)}")
 
             result = subprocess.run(
                 cmd,
@@ -169,6 +199,9 @@ class PluginLoader:
                 logger.error(f"Pip install failed: {result.stderr}")
                 return False
 
+            # Drop finder caches so find_spec/import see the new packages
+            importlib.invalidate_caches()
+            _installed_requirements.update(pending)
             logger.info("Dependencies installed successfully")
             return True
 
@@ -194,13 +227,25 @@ class PluginLoader:
         # Create a unique module name to avoid conflicts
         module_key = f"{plugin_path.name}.{entry_point}"
 
-        # Check if already loaded
-        if module_key in self._loaded_modules and not force_reload:
-            logger.debug(f"Using cached module: {module_key}")
-            return self._loaded_modules[module_key]
+        module_file = plugin_path / f"{entry_point}.py"
+
+        # Check if already loaded, by this loader or elsewhere in the process
+        # (e.g. another PluginLoader)
+        if not force_reload:
+            module = self._loaded_modules.get(module_key)
+            if module is None:
+                module = sys.modules.get(module_key)
+                # Only reuse a sys.modules entry imported from this plugin's entry file;
+                # an unrelated module can share the "<folder>.<entry>" name
+                module_path = getattr(module, "__file__", None)
+                if module_path is None or os.path.realpath(module_path) != os.path.realpath(module_file):
+                    module = None
+            if module is not None:
+                logger.debug("Using cached module: %s", module_key)
+                self._loaded_modules[module_key] = module
+                return module
 
         # Prepare module path
-        module_file = plugin_path / f"{entry_point}.py"
         if not module_file.exists():
             logger.error(f"Entry point not found: {module_file}")
             return None
@@ -39,14 +39,101 @@ Supported Methods:
 import asyncio
 import json
 import logging
+import time
 from collections.abc import Callable, Coroutine
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Optional
 
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 logger = logging.getLogger(__name__)
 
 
+def json_default(obj: Any) -> Any:
+    """
+    JSON encoder hook for contract wire types.
+
+    Plugin methods return contract dataclasses (SynthesisResult, CompletionResult,
+    Voice, ...). Each defines to_dict() with its wire shape, so the encoder
+    serializes them in place instead of requiring every handler to convert first.
+
+    Raises:
+        TypeError: If the object has no to_dict() method
+    """
+    to_dict = getattr(obj, "to_dict", None)
+    if to_dict is None:
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+    return to_dict()
+
+
+if HAS_ORJSON:
+    # Route dataclasses through json_default so their to_dict() wire shape is kept;
+    # allow int keys like stdlib json does.
+    _ORJSON_OPTIONS = orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_NON_STR_KEYS
+    _ORJSON_LINE_OPTIONS = _ORJSON_OPTIONS | orjson.OPT_APPEND_NEWLINE
+
+
+def encode_json(obj: Any) -> str:
+    """
+    Serialize a JSON-RPC message to a compact JSON string.
+
+    Uses orjson when installed, falling back to the stdlib json module.
+
+    Args:
+        obj: JSON-RPC message (dict) to serialize
+
+    Returns:
+        Compact JSON string (non-ASCII characters are not escaped)
+    """
+    if HAS_ORJSON:
+        return orjson.dumps(obj, default=json_default, option=_ORJSON_OPTIONS).decode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), default=json_default)
+
+
+def encode_json_line(obj: Any) -> bytes:
+    """
+    Serialize a JSON-RPC message to a newline-terminated UTF-8 frame.
+
+    Produces the exact bytes written to stdout, so the caller can emit a
+    message with a single write.
+
+    Args:
+        obj: JSON-RPC message (dict) to serialize
+
+    Returns:
+        Compact JSON encoded as UTF-8, followed by b"\\n"
+    """
+    if HAS_ORJSON:
+        return orjson.dumps(obj, default=json_default, option=_ORJSON_LINE_OPTIONS)
+    return (json.dumps(obj, ensure_ascii=False, separators=(",", ":"), default=json_default) + "\n").encode("utf-8")
+
+
+def decode_json(data: str | bytes) -> Any:
+    """
+    Parse a JSON-RPC message.
+
+    Uses orjson when installed, falling back to the stdlib json module.
+
+    Args:
+        data: Raw JSON text (str or UTF-8 bytes)
+
+    Returns:
+        Decoded Python object
+
+    Raises:
+        ValueError: If the input is not valid JSON (or not valid UTF-8)
+    """
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 # ============================================
 # JSON-RPC 2.0 DATA STRUCTURES
 # ============================================
@@ -181,7 +268,7 @@ class JsonRpcResponse:
 
     def to_json(self) -> str:
         """Convert to JSON string."""
-        return json.dumps(self.to_dict(), ensure_ascii=False)
+        return encode_json(self.to_dict())
 
     @classmethod
     def success(cls, id: str | int | None, result: Any) -> "JsonRpcResponse":
@@ -238,16 +325,21 @@ class ErrorCodes:
 # Handler signature: (params, request_id) -> result
 MethodHandler = Callable[[dict[str, Any] | None, str | int | None], Coroutine[Any, Any, Any]]
 
+# Synchronous handler signature, for methods that only touch in-memory state
+SyncMethodHandler = Callable[[dict[str, Any] | None, str | int | None], Any]
+
 
 @dataclass
 class MethodRegistration:
     """Registration information for a method handler."""
 
-    handler: MethodHandler
+    handler: MethodHandler | SyncMethodHandler
     description: str = ""
     requires_plugin: bool = False
     contract: str | None = None
     timeout_seconds: float | None = None
+    # Handler is a plain function: called directly, without a timeout or event loop
+    is_sync: bool = False
 
 
 # ============================================
@@ -305,7 +397,8 @@ class JsonRpcRouter:
         # Statistics
         self._request_count = 0
         self._error_count = 0
-        self._last_request_time: datetime | None = None
+        # Epoch seconds; formatted only when stats are requested
+        self._last_request_time: float | None = None
 
         # Register built-in methods
         self._register_builtin_methods()
@@ -316,31 +409,31 @@ class JsonRpcRouter:
         """Register built-in system methods."""
 
         # ping - basic health check
-        async def handle_ping(params, id):
+        def handle_ping(params, id):
             return "pong"
 
-        self._methods["ping"] = MethodRegistration(handler=handle_ping, description="Basic health check")
+        self._methods["ping"] = MethodRegistration(handler=handle_ping, description="Basic health check", is_sync=True)
 
         # status - get host status
-        async def handle_status(params, id):
+        def handle_status(params, id):
             return {
                 "version": "1.0.0",
                 "request_count": self._request_count,
                 "error_count": self._error_count,
-                "last_request": (self._last_request_time.isoformat() if self._last_request_time else None),
+                "last_request": self._last_request_isoformat(),
                 "registered_methods": list(self._methods.keys()),
             }
 
-        self._methods["status"] = MethodRegistration(handler=handle_status, description="Get host status")
+        self._methods["status"] = MethodRegistration(handler=handle_status, description="Get host status", is_sync=True)
 
         # plugin/list - list plugins
-        async def handle_plugin_list(params, id):
+        def handle_plugin_list(params, id):
             if not self.manager:
                 return []
             return self.manager.list_available()
 
         self._methods["plugin/list"] = MethodRegistration(
-            handler=handle_plugin_list, description="List all discovered plugins"
+            handler=handle_plugin_list, description="List all discovered plugins", is_sync=True
         )
 
         # plugin/load - load a plugin
@@ -399,7 +492,7 @@ class JsonRpcRouter:
         )
 
         # plugin/health - health check a plugin
-        async def handle_plugin_health(params, id):
+        def handle_plugin_health(params, id):
             if not self.manager:
                 raise RuntimeError("Plugin manager not available")
 
@@ -427,7 +520,7 @@ class JsonRpcRouter:
                 }
 
         self._methods["plugin/health"] = MethodRegistration(
-            handler=handle_plugin_health, description="Health check plugins"
+            handler=handle_plugin_health, description="Health check plugins", is_sync=True
         )
 
     def method(self, name: str, description: str = "", timeout: float | None = None):
@@ -459,17 +552,19 @@ class JsonRpcRouter:
         requires_plugin: bool = False,
         contract: str | None = None,
         timeout: float | None = None,
+        sync: bool = False,
     ) -> None:
         """
         Register a method handler.
 
         Args:
             name: Method name
-            handler: Async handler function
+            handler: Async handler function (plain function if sync=True)
             description: Method description
             requires_plugin: Whether method requires plugin to be loaded
             contract: Contract type for plugin method routing
-            timeout: Timeout in seconds
+            timeout: Timeout in seconds (not applied to sync handlers)
+            sync: Handler never awaits; call it directly without an event loop
         """
         self._methods[name] = MethodRegistration(
             handler=handler,
@@ -477,15 +572,19 @@ class JsonRpcRouter:
             requires_plugin=requires_plugin,
             contract=contract,
             timeout_seconds=timeout,
+            is_sync=sync,
         )
         logger.debug(f"Registered method: {name}")
 
-    def parse_request(self, line: str) -> tuple[JsonRpcRequest | None, JsonRpcResponse | None]:
+    def parse_request(self, line: str | bytes) -> tuple[JsonRpcRequest | None, JsonRpcResponse | None]:
         """
         Parse a JSON-RPC request from a line.
 
+        This is the only JSON decode per request; invalid JSON is reported
+        here as a PARSE_ERROR response.
+
         Args:
-            line: Raw JSON string
+            line: Raw JSON string or UTF-8 bytes
 
         Returns:
             Tuple of (request, error_response)
@@ -494,8 +593,8 @@ class JsonRpcRouter:
         """
         # Parse JSON
         try:
-            data = json.loads(line)
-        except json.JSONDecodeError as e:
+            data = decode_json(line)
+        except ValueError as e:
             return None, JsonRpcResponse.error_response(
                 id=None, code=ErrorCodes.PARSE_ERROR, message=f"Parse error: {e}"
             )
@@ -600,6 +699,9 @@ class JsonRpcRouter:
         """
         Handle a JSON-RPC request and return response.
 
+        Notifications never get a response object, not even for errors, so
+        callers have nothing to serialize for them.
+
         Args:
             request: Parsed JsonRpcRequest
 
@@ -607,20 +709,23 @@ class JsonRpcRouter:
             JsonRpcResponse, or None for notifications
         """
         self._request_count += 1
-        self._last_request_time = datetime.now()
+        self._last_request_time = time.time()
 
         method = request.method
         params = request.params if isinstance(request.params, dict) else {}
 
-        logger.debug(f"Handling request: method={method}, id={request.id}")
+        logger.debug("Handling request: method=%s, id=%s", method, request.id)
 
         try:
             # Check for static method first
             if method in self._methods:
                 registration = self._methods[method]
-                timeout = registration.timeout_seconds or self.default_timeout
 
-                result = await asyncio.wait_for(registration.handler(params, request.id), timeout=timeout)
+                if registration.is_sync:
+                    result = registration.handler(params, request.id)
+                else:
+                    timeout = registration.timeout_seconds or self.default_timeout
+                    result = await asyncio.wait_for(registration.handler(params, request.id), timeout=timeout)
 
                 # Don't return response for notifications
                 if request.is_notification:
@@ -640,25 +745,74 @@ class JsonRpcRouter:
                 return JsonRpcResponse.success(request.id, result)
 
             # Method not found
-            self._error_count += 1
-            return JsonRpcResponse.error_response(
-                id=request.id, code=ErrorCodes.METHOD_NOT_FOUND, message=f"Method not found: {method}"
-            )
+            return self._error_response(request, ErrorCodes.METHOD_NOT_FOUND, f"Method not found: {method}")
+
+        except Exception as e:
+            return self._exception_response(request, e)
+
+    def is_sync_handler(self, method: str) -> bool:
+        """
+        Check whether a method can be handled with call_sync().
+
+        Args:
+            method: Method name
 
-        except TimeoutError:
-            self._error_count += 1
+        Returns:
+            True if the method is registered with a synchronous handler
+        """
+        registration = self._methods.get(method)
+        return registration is not None and registration.is_sync
+
+    def call_sync(self, request: JsonRpcRequest) -> JsonRpcResponse | None:
+        """
+        Handle a request whose method has a synchronous handler.
+
+        Same result and error mapping as handle_request(), without entering
+        the event loop. Only valid when is_sync_handler(request.method).
+
+        Args:
+            request: Parsed JsonRpcRequest
+
+        Returns:
+            JsonRpcResponse, or None for notifications
+        """
+        self._request_count += 1
+        self._last_request_time = time.time()
+
+        params = request.params if isinstance(request.params, dict) else {}
+
+        try:
+            result = self._methods[request.method].handler(params, request.id)
+        except Exception as e:
+            return self._exception_response(request, e)
+
+        if request.is_notification:
+            return None
+
+        return JsonRpcResponse.success(request.id, result)
+
+    def _exception_response(self, request: JsonRpcRequest, exc: Exception) -> JsonRpcResponse | None:
+        """
+        Map a handler exception to a JSON-RPC error response.
+
+        Args:
+            request: Request that failed
+            exc: Exception raised while handling it
+
+        Returns:
+            Error JsonRpcResponse, or None if the request is a notification
+        """
+        method = request.method
+
+        if isinstance(exc, TimeoutError):
             logger.error(f"Method timed out: {method}")
-            return JsonRpcResponse.error_response(
-                id=request.id, code=ErrorCodes.INTERNAL_ERROR, message=f"Method timed out: {method}"
-            )
+            return self._error_response(request, ErrorCodes.INTERNAL_ERROR, f"Method timed out: {method}")
 
-        except ValueError as e:
-            self._error_count += 1
-            return JsonRpcResponse.error_response(id=request.id, code=ErrorCodes.INVALID_PARAMS, message=str(e))
+        if isinstance(exc, ValueError):
+            return self._error_response(request, ErrorCodes.INVALID_PARAMS, str(exc))
 
-        except RuntimeError as e:
-            self._error_count += 1
-            error_msg = str(e)
+        if isinstance(exc, RuntimeError):
+            error_msg = str(exc)
 
             # Map specific errors to codes
             if "not found" in error_msg.lower():
@@ -668,14 +822,29 @@ class JsonRpcRouter:
             else:
                 code = ErrorCodes.INTERNAL_ERROR
 
-            return JsonRpcResponse.error_response(id=request.id, code=code, message=error_msg)
+            return self._error_response(request, code, error_msg)
 
-        except Exception as e:
-            self._error_count += 1
-            logger.exception(f"Error handling request: {method}")
-            return JsonRpcResponse.error_response(
-                id=request.id, code=ErrorCodes.INTERNAL_ERROR, message=f"Internal error: {type(e).__name__}: {str(e)}"
-            )
+        logger.exception(f"Error handling request: {method}")
+        return self._error_response(
+            request, ErrorCodes.INTERNAL_ERROR, f"Internal error: {type(exc).__name__}: {str(exc)}"
+        )
+
+    def _error_response(self, request: JsonRpcRequest, code: int, message: str) -> JsonRpcResponse | None:
+        """
+        Count an error and build its response (None for notifications).
+
+        Args:
+            request: Request that failed
+            code: JSON-RPC error code
+            message: Error message
+
+        Returns:
+            Error JsonRpcResponse, or None if the request is a notification
+        """
+        self._error_count += 1
+        if request.is_notification:
+            return None
+        return JsonRpcResponse.error_response(id=request.id, code=code, message=message)
 
     async def process_line(self, line: str) -> str | None:
         """
@@ -705,6 +874,12 @@ class JsonRpcRouter:
 
         return None
 
+    def _last_request_isoformat(self) -> str | None:
+        """Format the last request time as a local ISO 8601 timestamp."""
+        if self._last_request_time is None:
+            return None
+        return datetime.fromtimestamp(self._last_request_time).isoformat()
+
     def get_methods(self) -> dict[str, str]:
         """Get registered methods with descriptions."""
         return {name: reg.description for name, reg in self._methods.items()}
@@ -715,7 +890,7 @@ class JsonRpcRouter:
             "request_count": self._request_count,
             "error_count": self._error_count,
             "method_count": len(self._methods),
-            "last_request": (self._last_request_time.isoformat() if self._last_request_time else None),
+            "last_request": self._last_request_isoformat(),
         }
 
 
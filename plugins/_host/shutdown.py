@@ -148,6 +148,13 @@ class ShutdownHandler:
         # Event loop reference for async shutdown from signal
         self._loop: asyncio.AbstractEventLoop | None = None
 
+        # Set once shutdown is initiated so async loops can await it instead of polling
+        self.shutdown_event = asyncio.Event()
+
+        # Set while no requests are in flight (awaited by wait_for_in_flight)
+        self._idle_event = asyncio.Event()
+        self._idle_event.set()
+
         logger.debug(
             f"ShutdownHandler initialized: shutdown_timeout={shutdown_timeout}s, request_timeout={request_timeout}s"
         )
@@ -205,9 +212,23 @@ class ShutdownHandler:
             self._state.reason = reason
             self._state.timestamp = datetime.now()
             self._state.exit_code = self.EXIT_CODES.get(reason, 1)
+            self._set_shutdown_event()
 
             logger.info(f"Shutdown initiated: {reason.value}")
 
+    def _set_shutdown_event(self) -> None:
+        """
+        Set shutdown_event, waking the event loop if it is blocked in select.
+
+        Signal handlers run outside the loop's callbacks, so the event is set
+        via call_soon_threadsafe (which writes to the loop's self-pipe).
+        """
+        loop = self._loop
+        if loop is not None and loop.is_running():
+            loop.call_soon_threadsafe(self.shutdown_event.set)
+        else:
+            self.shutdown_event.set()
+
     def _atexit_cleanup(self) -> None:
         """Emergency cleanup on exit."""
         if self._in_flight:
@@ -256,6 +277,7 @@ class ShutdownHandler:
         """
         if not self._state.initiated:
             self._in_flight.add(request_id)
+            self._idle_event.clear()
 
     def request_completed(self, request_id: int) -> None:
         """
@@ -265,6 +287,8 @@ class ShutdownHandler:
             request_id: JSON-RPC request ID
         """
         self._in_flight.discard(request_id)
+        if not self._in_flight:
+            self._idle_event.set()
 
     async def wait_for_in_flight(self) -> bool:
         """
@@ -278,9 +302,10 @@ class ShutdownHandler:
 
         logger.info(f"Waiting for {len(self._in_flight)} in-flight requests...")
 
-        start = time.time()
-        while self._in_flight and (time.time() - start) < self.request_timeout:
-            await asyncio.sleep(0.1)
+        try:
+            await asyncio.wait_for(self._idle_event.wait(), timeout=self.request_timeout)
+        except TimeoutError:
+            pass
 
         if self._in_flight:
             logger.warning(f"Timeout: {len(self._in_flight)} requests still in-flight")
@@ -512,6 +537,7 @@ def create_shutdown_handler(
         Configured ShutdownHandler
     """
     handler = ShutdownHandler(manager=manager)
+    handler._loop = loop
 
     if install_signals:
         handler.install_signal_handlers(loop)
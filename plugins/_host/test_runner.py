@@ -437,7 +437,7 @@ class PluginTestRunner:
                 result = await asyncio.wait_for(method_callable(**params), timeout=timeout)
             else:
                 # Wrap sync function in executor
-                loop = asyncio.get_event_loop()
+                loop = asyncio.get_running_loop()
                 result = await asyncio.wait_for(
                     loop.run_in_executor(None, lambda: method_callable(**params)), timeout=timeout
                 )
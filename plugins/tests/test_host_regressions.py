@@ -0,0 +1,345 @@
+"""
+Test Script: Plugin Host Regressions
+====================================
+Covers behavior changed by the host/contract performance work: caches and
+their invalidation, rate limiting, concurrent and sync dispatch, and the
+edge cases fixed in review. Needs no plugin dependencies or models.
+
+Usage:
+    python -m pytest plugins/tests/test_host_regressions.py -q
+"""
+
+import argparse
+import asyncio
+import importlib
+import logging
+import os
+import subprocess
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, project_root)
+
+from contracts.llm_contract import CompletionOptions  # noqa: E402
+from contracts.stt_contract import TranscriptionOptions  # noqa: E402
+from contracts.tts_contract import AudioFormat, SynthesisOptions, Voice  # noqa: E402
+from plugins._host import __main__ as host_main  # noqa: E402
+from plugins._host import add_file_logging, configure_host_logging  # noqa: E402
+from plugins._host.discovery import HybridDiscovery  # noqa: E402
+from plugins._host.isolation import CrashRateLimiter, IsolatedExecutor  # noqa: E402
+from plugins._host.loader import PluginLoader  # noqa: E402
+from plugins._host.protocol import JsonRpcRequest, JsonRpcRouter  # noqa: E402
+from plugins._host.shutdown import ShutdownHandler  # noqa: E402
+from plugins.tts_example_plugin.plugin import ExampleTTSPlugin  # noqa: E402
+
+PLUGINS_DIR = Path(project_root) / "plugins"
+CONFIG_DIR = Path(project_root) / "config"
+EXAMPLE_PLUGIN = "tts_example_plugin"
+
+
+# ============================================
+# CONTRACTS PACKAGE
+# ============================================
+
+
+def test_contracts_exports_are_unique_and_resolve():
+    contracts = importlib.import_module("contracts")
+
+    assert len(contracts.__all__) == len(set(contracts.__all__))
+    for name in contracts.__all__:
+        value = getattr(contracts, name)
+        submodule = sys.modules[f"contracts.{contracts._LAZY_EXPORTS[name]}"]
+        assert value is getattr(submodule, name)
+
+
+def test_contracts_import_is_lazy():
+    code = "import sys, contracts; print(sorted(m for m in sys.modules if m.startswith('contracts.')))"
+    out = subprocess.run([sys.executable, "-c", code], cwd=project_root, capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == "[]"
+
+
+# ============================================
+# from_dict FAST PATHS
+# ============================================
+
+
+def test_completion_options_fast_path_matches_slow_path():
+    data = {"model": "m", "temperature": 0.5, "max_tokens": 10}
+    assert CompletionOptions.from_dict(data) == CompletionOptions.from_dict({**data, "unknown": 1})
+    assert CompletionOptions.from_dict({}) == CompletionOptions()
+
+
+def test_synthesis_options_fast_path_converts_format():
+    fast = SynthesisOptions.from_dict({"speed": 1.5, "format": "mp3"})
+    slow = SynthesisOptions.from_dict({"speed": 1.5, "format": "mp3", "extra": True})
+    assert fast == slow
+    assert fast.format is AudioFormat.MP3
+
+
+def test_transcription_options_fast_path_matches_slow_path():
+    data = {"language": "en", "beam_size": 3}
+    fast = TranscriptionOptions.from_dict(data)
+    assert fast == TranscriptionOptions.from_dict({**data, "extra": True})
+    # Defaults built by factories must not be shared between instances
+    assert fast.suppress_tokens is not TranscriptionOptions.from_dict(data).suppress_tokens
+
+
+# ============================================
+# TTS LANGUAGES CACHE
+# ============================================
+
+
+def _voice(voice_id, language):
+    return Voice(id=voice_id, name=voice_id, language=language, gender="neutral")
+
+
+def test_supported_languages_cache_invalidation():
+    plugin = ExampleTTSPlugin()
+    before = plugin.get_supported_languages()
+    assert before == list(dict.fromkeys(v.language for v in plugin.get_voices()))
+
+    # In-place edits need an explicit invalidation
+    plugin._voices[0] = _voice("x", "ja-JP")
+    assert plugin.get_supported_languages() == before
+    plugin.invalidate_languages_cache()
+    assert plugin.get_supported_languages()[0] == "ja-JP"
+
+    # Assigning a new list invalidates automatically
+    plugin._voices = [_voice("y", "fr-FR")]
+    assert plugin.get_supported_languages() == ["fr-FR"]
+
+    # Callers can't corrupt the cache through the returned list
+    plugin.get_supported_languages().append("de-DE")
+    assert plugin.get_supported_languages() == ["fr-FR"]
+
+
+# ============================================
+# DISCOVERY
+# ============================================
+
+
+def test_discovery_does_not_import_yaml_eagerly():
+    code = "import sys, plugins._host.discovery; print('yaml' in sys.modules)"
+    out = subprocess.run([sys.executable, "-c", code], cwd=project_root, capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == "False"
+
+
+def test_prefix_cache_is_not_shared_and_follows_file_changes(tmp_path):
+    prefixes_file = tmp_path / "contract_prefixes.yaml"
+    prefixes_file.write_text("prefixes:\n  tts:\n    description: TTS\n", encoding="utf-8")
+
+    first = HybridDiscovery(tmp_path / "plugins", tmp_path)
+    first.get_prefix_info("tts")["description"] = "changed"
+    second = HybridDiscovery(tmp_path / "plugins", tmp_path)
+    assert second.get_prefix_info("tts") == {"description": "TTS"}
+
+    # A different size changes the cache key, so the file is re-read
+    prefixes_file.write_text("prefixes:\n  tts: {}\n  llm: {}\n", encoding="utf-8")
+    assert HybridDiscovery(tmp_path / "plugins", tmp_path).valid_prefixes == {"tts", "llm"}
+
+
+def test_empty_prefixes_file(tmp_path):
+    (tmp_path / "contract_prefixes.yaml").write_text("", encoding="utf-8")
+    assert HybridDiscovery(tmp_path / "plugins", tmp_path).valid_prefixes == frozenset()
+
+
+def test_find_plugin_returns_independent_results():
+    discovery = HybridDiscovery(PLUGINS_DIR, CONFIG_DIR)
+    first = discovery.find_plugin(EXAMPLE_PLUGIN)
+    assert first is not None and first.valid
+
+    first.manifest["name"] = "mutated"
+    second = discovery.find_plugin(EXAMPLE_PLUGIN)
+    assert second.manifest["name"] == EXAMPLE_PLUGIN
+    assert discovery.find_plugin("does_not_exist_plugin") is None
+
+
+def test_contracts_summary_lists_valid_plugins():
+    discovery = HybridDiscovery(PLUGINS_DIR, CONFIG_DIR)
+    summary = discovery.get_contracts_summary()
+    assert set(summary) == discovery.valid_prefixes
+    assert EXAMPLE_PLUGIN in summary["tts"]
+
+
+# ============================================
+# CRASH RATE LIMITING AND HISTORY
+# ============================================
+
+
+def test_rate_limiter_window():
+    limiter = CrashRateLimiter(window_seconds=10.0, max_reports=2)
+    results = [limiter.should_report("p", now=t) for t in (0.0, 1.0, 2.0, 3.0)]
+    assert results == [True, True, False, False]
+    assert limiter.get_crash_count("p", now=3.0) == 2
+
+    # Entries expire once t <= now - window; reporting resumes and the suppressed count resets
+    assert limiter.should_report("p", now=10.0) is True
+    assert limiter._suppressed_counts == {}
+    assert limiter.get_crash_count("p", now=11.5) == 1
+
+
+def test_rate_limiter_reads_do_not_insert():
+    limiter = CrashRateLimiter()
+    assert limiter.get_crash_count("never_crashed") == 0
+    assert limiter._crash_times == {}
+
+
+def _fail():
+    raise ValueError("boom")
+
+
+def test_crash_history_is_bounded_and_newest_first():
+    executor = IsolatedExecutor(max_crash_history=3, crash_rate_limit=1)
+    for i in range(5):
+        executor.execute_sync(f"p{i % 2}", "m", _fail)
+
+    assert [r.plugin_name for r in executor.get_crash_history()] == ["p0", "p1", "p0"]
+    assert [r.plugin_name for r in executor.get_crash_history("p1")] == ["p1"]
+    assert executor.get_crash_history(limit=0) == []
+    assert executor.get_crash_count("p0") == 3
+
+    # Only the first crash was logged (rate limit 1), so only it has a traceback
+    reports = list(executor._crash_history)
+    assert all(r.exception is None for r in reports)
+    assert all(r.traceback == "" for r in reports)
+
+    assert executor.clear_crash_history("p0") == 2
+    assert executor._crash_history.maxlen == 3
+
+
+def test_isolated_execute_timeout_and_success():
+    async def slow():
+        await asyncio.sleep(1)
+
+    async def fast(value):
+        return value
+
+    async def run():
+        executor = IsolatedExecutor()
+        timed_out = await executor.execute("p", "slow", slow, timeout_seconds=0.01)
+        ok = await executor.execute("p", "fast", fast, args=(5,), timeout_seconds=float("inf"))
+        return timed_out, ok
+
+    timed_out, ok = asyncio.run(run())
+    assert not timed_out.success
+    assert timed_out.error_code == -32060
+    assert ok.success and ok.result == 5
+
+
+# ============================================
+# ROUTER DISPATCH
+# ============================================
+
+
+def test_sync_handlers_bypass_event_loop():
+    router = JsonRpcRouter()
+    assert router.is_sync_handler("ping")
+
+    request = JsonRpcRequest(jsonrpc="2.0", method="ping", id=1)
+    assert router.call_sync(request).result == "pong"
+    assert asyncio.run(router.handle_request(request)).result == "pong"
+
+
+def test_requests_are_dispatched_concurrently(monkeypatch):
+    sent = []
+    monkeypatch.setattr(host_main, "send_response", sent.append)
+
+    async def handle_slow(params, id):
+        await asyncio.sleep(0.1)
+        return "slow"
+
+    async def run():
+        router = JsonRpcRouter()
+        router.register_method("test/slow", handle_slow)
+        shutdown_handler = ShutdownHandler()
+        slots = asyncio.Semaphore(2)
+        tasks = []
+        requests = (
+            JsonRpcRequest(jsonrpc="2.0", method="test/slow", id=1),
+            JsonRpcRequest(jsonrpc="2.0", method="ping", id=2),
+        )
+        for request in requests:
+            await slots.acquire()
+            shutdown_handler.request_started(request.id)
+            tasks.append(asyncio.create_task(host_main.dispatch_request(router, request, shutdown_handler, slots)))
+        await asyncio.gather(*tasks)
+        return slots
+
+    slots = asyncio.run(run())
+    # The fast request is answered while the slow one is still running
+    assert [response["id"] for response in sent] == [2, 1]
+    assert not slots.locked()
+
+
+# ============================================
+# HOST STARTUP AND LOGGING
+# ============================================
+
+
+@pytest.mark.parametrize("bad_path", ["file/inside", "loop", "missing"])
+def test_unresolvable_plugins_dir_reports_error(tmp_path, monkeypatch, bad_path):
+    (tmp_path / "file").write_text("", encoding="utf-8")
+    (tmp_path / "loop").symlink_to(tmp_path / "loop")
+    sent = []
+    monkeypatch.setattr(host_main, "send_response", sent.append)
+
+    args = argparse.Namespace(plugins_dir=str(tmp_path / bad_path), config_dir=str(tmp_path / "config"))
+    assert host_main.resolve_host_directories(args) is None
+    assert sent[0]["error"]["message"].startswith("Plugins directory not found")
+
+
+def test_file_logging_replaces_previous_listener(tmp_path):
+    from plugins import _host
+
+    configure_host_logging("DEBUG")
+    add_file_logging(tmp_path / "a.log")
+    first_handler = _host._file_listener.handlers[0]
+    add_file_logging(tmp_path / "b.log")
+
+    assert first_handler.stream is None  # closed
+    configure_host_logging("INFO")
+    assert _host._file_listener is None
+    assert not any(isinstance(h, logging.handlers.QueueHandler) for h in logging.getLogger("plugin_host").handlers)
+
+
+def test_host_logging_leaves_global_record_flags_alone():
+    before = (logging._srcfile, logging.logThreads, logging.logProcesses, logging.logMultiprocessing)
+    configure_host_logging("INFO", log_format="%(message)s")
+    assert (logging._srcfile, logging.logThreads, logging.logProcesses, logging.logMultiprocessing) == before
+
+
+# ============================================
+# LOADER
+# ============================================
+
+
+def test_loader_ignores_unrelated_sys_modules_entry(monkeypatch):
+    plugin_path = (PLUGINS_DIR / EXAMPLE_PLUGIN).resolve()
+    module_key = f"{EXAMPLE_PLUGIN}.plugin"
+    decoy = types.ModuleType(module_key)
+    decoy.__file__ = os.path.join(os.sep, "elsewhere", "plugin.py")
+    monkeypatch.setitem(sys.modules, module_key, decoy)
+
+    module = PluginLoader().import_module(plugin_path, "plugin")
+    assert module is not decoy
+    assert Path(module.__file__).resolve() == plugin_path / "plugin.py"
+
+    # A genuine earlier import is reused by another loader
+    assert PluginLoader().import_module(plugin_path, "plugin") is module
+
+
+def test_check_dependencies_parses_requirement_names():
+    installed, missing = PluginLoader().check_dependencies(
+        ["pytest>=7", "pytest[extra]~=7.0", "pytest ; python_version>'3'", "no-such-package-xyz==1", ""]
+    )
+    assert installed == ["pytest>=7", "pytest[extra]~=7.0", "pytest ; python_version>'3'"]
+    assert missing == ["no-such-package-xyz==1", ""]
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))